@@ -0,0 +1,50 @@
+"""Per-fetch latency with and without the pooled HTTP session.
+
+Fetches one URL repeatedly, first with a fresh curl_cffi request per call
+(the old module-level get) and then through research._fetch's per-thread
+session, and prints the median and mean of each.
+
+Usage:
+    uv run python bench/fetch_latency.py URL [--count N]
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Callable
+
+import click
+from curl_cffi import requests
+from research._fetch import _TIMEOUT, _get_session
+
+
+def _time_fetches(fetch: Callable[[], object], count: int) -> list[float]:
+    fetch()  # warm DNS and the impersonation profile outside the timing
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fetch()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+@click.command()
+@click.argument("url")
+@click.option("--count", default=20, show_default=True, help="timed fetches per mode")
+def main(url: str, count: int) -> None:
+    """Compare per-fetch latency for URL without and with connection reuse."""
+    modes = {
+        "per-call get": lambda: requests.get(url, impersonate="safari", timeout=_TIMEOUT),
+        "pooled session": lambda: _get_session().get(url, timeout=_TIMEOUT),
+    }
+    for label, fetch in modes.items():
+        samples = _time_fetches(fetch, count)
+        click.echo(
+            f"{label}: median {statistics.median(samples):.1f} ms, "
+            f"mean {statistics.mean(samples):.1f} ms over {count} fetches"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""--find latency with the stored paragraph index vs a linear scan.
+
+For each pattern, times apply_find over the whole document (the scan used
+without an index) against loading the compressed index the way
+read_cached_index does and running apply_find with it. Also prints the
+index build time and its stored size.
+
+Usage:
+    uv run python bench/find_index.py FILE [--find PATTERN ...] [--rounds N]
+
+FILE is a markdown or text document of at least INDEX_MIN_CHARS characters.
+"""
+
+from __future__ import annotations
+
+import pickle
+import statistics
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import click
+from research._cache import _CONTENT_CODEC, _compress_bytes, _decompress_bytes
+from research._index import INDEX_MIN_CHARS, build_index
+from research._render import DEFAULT_MAX_CHARS, apply_find
+
+_DEFAULT_PATTERNS = ("error", "the borrow checker", "trait object", "unsafe|lifetime", "Vec<T>")
+
+
+def _median_ms(run: Callable[[], object], rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _load(data: bytes) -> dict:
+    """Decompress and unpickle a stored index, as read_cached_index does."""
+    return pickle.loads(_decompress_bytes(_CONTENT_CODEC, data) or b"")
+
+
+def _indexed_find(text: str, pattern: str, data: bytes) -> str:
+    return apply_find(text, [pattern], 1, DEFAULT_MAX_CHARS, _load(data))
+
+
+@click.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--find", "patterns", multiple=True, help="pattern to time (repeatable)")
+@click.option("--rounds", default=20, show_default=True, help="timed runs per measurement")
+def main(path: Path, patterns: tuple[str, ...], rounds: int) -> None:
+    """Compare indexed and linear --find on one document."""
+    text = path.read_text(errors="replace")
+    if len(text) < INDEX_MIN_CHARS:
+        raise click.UsageError(f"document has {len(text)} chars; need {INDEX_MIN_CHARS}")
+
+    start = time.perf_counter()
+    index = build_index(text)
+    built = (time.perf_counter() - start) * 1000
+    raw = pickle.dumps(index, pickle.HIGHEST_PROTOCOL)
+    data = _compress_bytes(raw)
+    click.echo(
+        f"document: {len(text)} chars, {len(index['offsets'])} paragraphs, "
+        f"{len(index['terms'])} terms"
+    )
+    click.echo(
+        f"index: built in {built:.1f} ms, {len(raw)} bytes pickled, "
+        f"{len(data)} stored ({_CONTENT_CODEC})"
+    )
+
+    click.echo(f"load: {_median_ms(partial(_load, data), rounds):.2f} ms")
+    for pattern in patterns or _DEFAULT_PATTERNS:
+        linear = _median_ms(partial(apply_find, text, [pattern], 1, DEFAULT_MAX_CHARS), rounds)
+        indexed = _median_ms(partial(_indexed_find, text, pattern, data), rounds)
+        click.echo(f"{pattern!r}: linear {linear:.2f} ms, indexed with load {indexed:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""CPU time to classify and extract saved pages, string-based vs one shared parse.
+
+The string path is the old fetch_page flow: a regex title scan for challenge
+markers, then trafilatura.extract on the raw text, which parses it again. The
+shared path parses once with _parse_html and hands the tree to both the
+challenge check and _extract_markdown.
+
+Usage:
+    uv run python bench/parse_once.py CORPUS_DIR [--rounds N]
+
+CORPUS_DIR holds saved pages (*.html, searched recursively).
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import click
+import trafilatura
+from research._fetch import (
+    _CHALLENGE_BODY_MARKERS,
+    _CHALLENGE_BODY_MAX_CHARS,
+    _CHALLENGE_TITLE_MARKERS,
+    _extract_markdown,
+    _is_challenge_page,
+    _parse_html,
+)
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+def _string_path(text: str) -> str | None:
+    match = _TITLE_RE.search(text)
+    if match and any(marker in match.group(1).lower() for marker in _CHALLENGE_TITLE_MARKERS):
+        return None
+    if len(text) <= _CHALLENGE_BODY_MAX_CHARS:
+        lower = text.lower()
+        if any(marker in lower for marker in _CHALLENGE_BODY_MARKERS):
+            return None
+    return trafilatura.extract(
+        text, output_format="markdown", include_links=True, include_tables=True
+    )
+
+
+def _shared_path(text: str) -> str | None:
+    tree = _parse_html(text)
+    if _is_challenge_page(tree, text):
+        return None
+    return _extract_markdown(tree)
+
+
+def _cpu_seconds(run: Callable[[str], str | None], pages: list[str], rounds: int) -> float:
+    start = time.process_time()
+    for _ in range(rounds):
+        for text in pages:
+            run(text)
+    return time.process_time() - start
+
+
+@click.command()
+@click.argument("corpus", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("--rounds", default=3, show_default=True, help="passes over the corpus per path")
+def main(corpus: Path, rounds: int) -> None:
+    """Compare CPU time per page for the string and shared-tree paths."""
+    pages = [path.read_text(errors="replace") for path in sorted(corpus.rglob("*.html"))]
+    if not pages:
+        raise click.UsageError(f"no *.html files under {corpus}")
+    size = sum(len(text) for text in pages)
+    click.echo(f"corpus: {len(pages)} pages, {size / 1024 / 1024:.1f} MiB")
+    for label, run in (("string", _string_path), ("shared tree", _shared_path)):
+        _cpu_seconds(run, pages[:5], 1)  # warm trafilatura's lazy imports
+        seconds = _cpu_seconds(run, pages, rounds)
+        per_page = seconds / (len(pages) * rounds) * 1000
+        click.echo(f"{label}: {per_page:.2f} ms CPU per page over {rounds} rounds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""PDF conversion throughput at different pdf2md worker counts.
+
+Runs `pdf2md PDF --json --jobs N` once per worker count and prints pages per
+second. Per-page JSON output is never cached by pdf2md, so every run
+converts the whole document. --force-ocr sends every page through OCR,
+which is the path the worker pool parallelizes.
+
+Usage:
+    uv run python bench/pdf_pages.py FILE.pdf [--jobs 1,2,4] [--force-ocr]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shlex
+import subprocess
+import time
+
+import click
+
+
+@click.command()
+@click.argument("pdf", type=click.Path(exists=True, dir_okay=False))
+@click.option("--jobs", default=f"1,{os.cpu_count() or 1}", show_default=True, help="worker counts")
+@click.option("--force-ocr", is_flag=True, help="OCR every page instead of reading the text layer")
+@click.option("--pdf2md", "command", default="pdf2md", show_default=True, help="pdf2md command")
+def main(pdf: str, jobs: str, force_ocr: bool, command: str) -> None:
+    """Print pages per second for each worker count."""
+    for count in dict.fromkeys(int(n) for n in jobs.split(",")):
+        argv = [*shlex.split(command), pdf, "--json", "--jobs", str(count)]
+        if force_ocr:
+            argv.append("--force-ocr")
+        start = time.perf_counter()
+        result = subprocess.run(argv, capture_output=True, text=True, check=False)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise click.ClickException(f"pdf2md failed: {result.stderr.strip()}")
+        pages = len(json.loads(result.stdout)["pages"])
+        click.echo(f"jobs {count}: {pages} pages in {elapsed:.1f}s ({pages / elapsed:.1f} pages/s)")
+
+
+if __name__ == "__main__":
+    main()
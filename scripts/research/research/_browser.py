@@ -3,28 +3,54 @@
 All playwright imports are lazy. If the Python packages are missing, they are
 auto-installed via uv on first use. If the Chromium browser binary is missing,
 ``playwright install chromium`` runs automatically.
+
+Playwright's sync API is bound to the thread that started it, so every browser
+call runs on one dedicated worker thread; concurrent fetch threads queue there.
+
+With RESEARCH_BROWSER_DAEMON=1 the browser is a shared, already-warm Chromium
+reached through a Playwright browser server (see research._browser_daemon)
+instead of a per-process launch.
 """
 
 from __future__ import annotations
 
 import atexit
+import os
+import queue
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any
 
 import click
 
 _BROWSER_TIMEOUT = 30_000  # milliseconds
-_CHALLENGE_SETTLE = 3_000  # milliseconds; wait for challenge redirect
+_CHALLENGE_SETTLE = 3_000  # milliseconds; upper bound on post-load settling
+
+# Subresources never needed for text extraction; aborted to cut load time.
+_BLOCKED_RESOURCES = frozenset({"image", "media", "font"})
+
+# True once the title carries no challenge marker (arg: lowercase markers).
+_TITLE_CLEAR_JS = """markers => {
+    const title = document.title.toLowerCase();
+    return !markers.some(marker => title.includes(marker));
+}"""
 
 _PACKAGES = ["playwright>=1.50", "playwright-stealth>=2.0"]
+_USE_DAEMON = os.environ.get("RESEARCH_BROWSER_DAEMON", "") not in ("", "0")
 
 _pw: Any = None
 _browser: Any = None
 _stealth: Any = None
 
+_jobs: queue.Queue[tuple[str, Future[str]] | None] = queue.Queue()
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
+
 
 def _ensure_packages() -> None:
     """Install playwright packages via uv if not importable."""
@@ -79,7 +105,9 @@ def _ensure_browser(pw: Any) -> None:
 def _get_browser() -> Any:
     """Return a singleton browser instance, launching on first call.
 
-    Auto-installs Python packages and Chromium binary as needed.
+    Attaches to the browser daemon when enabled, falling back to a local
+    launch if it cannot start. Auto-installs Python packages and Chromium
+    binary as needed.
     """
     global _pw, _browser
 
@@ -89,16 +117,25 @@ def _get_browser() -> Any:
     _ensure_packages()
     from playwright.sync_api import sync_playwright
 
-    _pw = sync_playwright().start()
+    if _pw is None:
+        _pw = sync_playwright().start()
+    if _USE_DAEMON:
+        from research._browser_daemon import daemon_endpoint
+
+        try:
+            _browser = _pw.chromium.connect(daemon_endpoint())
+            return _browser
+        except Exception as e:  # noqa: BLE001
+            click.echo(f"[browser daemon unavailable: {e}; launching locally]", err=True)
     _ensure_browser(_pw)
     _browser = _pw.chromium.launch(headless=True)
-    atexit.register(_shutdown)
     return _browser
 
 
 def _shutdown() -> None:
     global _pw, _browser
     if _browser:
+        # On a daemon connection this only disconnects; the shared Chromium stays up.
         _browser.close()
         _browser = None
     if _pw:
@@ -106,13 +143,74 @@ def _shutdown() -> None:
         _pw = None
 
 
+def _run_worker() -> None:
+    """Serve browser jobs on this thread until a None sentinel arrives."""
+    while (job := _jobs.get()) is not None:
+        url, future = job
+        try:
+            future.set_result(_render(url))
+        except BaseException as e:  # noqa: BLE001
+            future.set_exception(e)
+    _shutdown()
+
+
+def _stop_worker() -> None:
+    if _worker is not None and _worker.is_alive():
+        _jobs.put(None)
+        _worker.join()
+
+
 def fetch_with_browser(url: str) -> str:
     """Fetch URL using a headless Chromium browser; returns rendered HTML.
 
     Uses a singleton browser process (launched once, reused across calls).
     Applies stealth patches to avoid bot detection of headless Chromium.
     Auto-installs Python packages and Chromium binary on first use if missing.
+    Safe to call from any thread.
     """
+    global _worker
+
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_run_worker, name="research-browser", daemon=True)
+            _worker.start()
+            atexit.register(_stop_worker)
+    future: Future[str] = Future()
+    _jobs.put((url, future))
+    return future.result()
+
+
+def _route_resource(route: Any) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _settle(page: Any) -> None:
+    """Wait until challenge title markers are gone and the network is idle.
+
+    Ordinary pages pass the title check at once and return as soon as the
+    network goes quiet; challenge pages wait for their redirect. The whole
+    wait is capped at _CHALLENGE_SETTLE.
+    """
+    from playwright.sync_api import Error as PlaywrightError
+
+    from research._fetch import _CHALLENGE_TITLE_MARKERS
+
+    deadline = time.monotonic() + _CHALLENGE_SETTLE / 1000
+    try:
+        page.wait_for_function(
+            _TITLE_CLEAR_JS, arg=list(_CHALLENGE_TITLE_MARKERS), timeout=_CHALLENGE_SETTLE
+        )
+        remaining = max(1, int((deadline - time.monotonic()) * 1000))
+        page.wait_for_load_state("networkidle", timeout=remaining)
+    except PlaywrightError:
+        pass  # timed out or navigated mid-check; take the page as it stands
+
+
+def _render(url: str) -> str:
+    """Load URL in a fresh stealth context; must run on the browser thread."""
     global _stealth
 
     browser = _get_browser()
@@ -122,10 +220,13 @@ def fetch_with_browser(url: str) -> str:
         _stealth = Stealth()
     context = browser.new_context()
     _stealth.apply_stealth_sync(context)
+    context.route("**/*", _route_resource)
     page = context.new_page()
     try:
         page.goto(url, wait_until="domcontentloaded", timeout=_BROWSER_TIMEOUT)
-        page.wait_for_timeout(_CHALLENGE_SETTLE)
+        _settle(page)
+        # A challenge redirect may still be in flight when the settle cap hits.
+        page.wait_for_load_state("domcontentloaded", timeout=_BROWSER_TIMEOUT)
         return page.content()
     finally:
         context.close()
@@ -0,0 +1,178 @@
+"""Opt-in long-lived headless Chromium shared across research invocations.
+
+Every `research` call is a new process, so the in-process browser singleton
+pays a multi-second Chromium cold start on each challenge-page fallback. With
+RESEARCH_BROWSER_DAEMON=1, the first fallback spawns this daemon. It keeps one
+Chromium running behind a Playwright browser server and hands out the server's
+endpoint over an owner-only Unix socket, and exits after RESEARCH_BROWSER_IDLE
+seconds without a client.
+
+Chromium itself has no debugging port: the server drives it over
+--remote-debugging-pipe. The server's websocket on localhost only accepts the
+random path in its endpoint, so other local users cannot drive the browser.
+
+Run directly with ``python -m research._browser_daemon``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import click
+
+from research._cache import _BASE_CACHE_DIR
+
+IDLE_TIMEOUT: int = int(os.environ.get("RESEARCH_BROWSER_IDLE") or 600)
+
+_SOCKET_PATH = _BASE_CACHE_DIR / "browser.sock"
+_LOCK_PATH = _BASE_CACHE_DIR / "browser.lock"
+_SERVER_CONFIG_PATH = _BASE_CACHE_DIR / "browser-server.json"  # launchServer options
+_START_TIMEOUT = 60.0  # seconds; covers a first-run Chromium install
+_ENDPOINT_TIMEOUT = 15.0  # seconds for the browser server to publish its endpoint
+_ACCEPT_POLL = 5.0  # seconds between idle checks
+
+
+def _request_endpoint() -> str | None:
+    """Ask a running daemon for its server endpoint; None if none is listening."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(2.0)
+            client.connect(str(_SOCKET_PATH))
+            line = client.makefile("r").readline()
+    except OSError:
+        return None
+    return line.strip() or None
+
+
+def daemon_endpoint() -> str:
+    """Return the daemon's browser server endpoint, starting the daemon if needed."""
+    endpoint = _request_endpoint()
+    if endpoint:
+        return endpoint
+    click.echo("[starting browser daemon]", err=True)
+    subprocess.Popen(
+        [sys.executable, "-m", "research._browser_daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.2)
+        endpoint = _request_endpoint()
+        if endpoint:
+            return endpoint
+    raise RuntimeError(f"browser daemon did not start within {_START_TIMEOUT:.0f}s")
+
+
+def _launch_server() -> subprocess.Popen[str]:
+    """Start a Playwright browser server, installing Chromium on first use.
+
+    Uses the playwright CLI's launch-server command, which prints the
+    server's endpoint once Chromium is up. The server gets its own process
+    group so _stop_server can take down the CLI wrapper and Node together.
+    """
+    from research._browser import _ensure_browser, _ensure_packages
+
+    _ensure_packages()
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as pw:
+        _ensure_browser(pw)
+    _SERVER_CONFIG_PATH.write_text(json.dumps({"headless": True, "host": "127.0.0.1"}))
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "playwright",
+            "launch-server",
+            "--browser",
+            "chromium",
+            "--config",
+            str(_SERVER_CONFIG_PATH),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        start_new_session=True,
+    )
+
+
+def _stop_server(server: subprocess.Popen[str]) -> None:
+    """Terminate the server's process group; Playwright closes Chromium on SIGTERM."""
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(server.pid, signal.SIGTERM)
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(server.pid, signal.SIGKILL)
+        server.wait()
+
+
+def _wait_endpoint(server: subprocess.Popen[str]) -> str:
+    """Read the websocket endpoint the browser server prints on startup."""
+    assert server.stdout is not None
+    ready, _, _ = select.select([server.stdout], [], [], _ENDPOINT_TIMEOUT)
+    endpoint = server.stdout.readline().strip() if ready else ""
+    if not endpoint:
+        raise RuntimeError("browser server did not publish an endpoint")
+    return endpoint
+
+
+def _serve_endpoint(endpoint: str, server: subprocess.Popen[str]) -> None:
+    """Answer endpoint requests until the server exits or no client arrives for IDLE_TIMEOUT."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        _SOCKET_PATH.unlink(missing_ok=True)
+        old_umask = os.umask(0o077)
+        try:
+            listener.bind(str(_SOCKET_PATH))
+        finally:
+            os.umask(old_umask)
+        listener.listen()
+        listener.settimeout(_ACCEPT_POLL)
+        last_client = time.monotonic()
+        while server.poll() is None and time.monotonic() - last_client < IDLE_TIMEOUT:
+            try:
+                conn, _ = listener.accept()
+            except TimeoutError:
+                continue
+            with conn:
+                conn.sendall(f"{endpoint}\n".encode())
+            last_client = time.monotonic()
+
+
+def serve() -> None:
+    """Run the daemon in the foreground; returns at once if one is already running."""
+    _BASE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    lock = open(_LOCK_PATH, "w")  # noqa: SIM115
+    try:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock.close()
+        return
+    try:
+        server = _launch_server()
+        try:
+            _serve_endpoint(_wait_endpoint(server), server)
+        finally:
+            _SOCKET_PATH.unlink(missing_ok=True)
+            _stop_server(server)
+    finally:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+        lock.close()
+
+
+if __name__ == "__main__":
+    serve()
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import os
 import sys
+import time
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import click
 
+from research._cache import cache_url, get_budget_store, get_session_id
+
 if TYPE_CHECKING:
     from diskcache import Cache
 
@@ -17,10 +21,19 @@ WARNING_AT: int = MAX_CALLS - 3  # final warning
 
 _COUNT_KEY = "budget:count"
 _SEEN_PREFIX = "seen:"
+_WARM_PREFIX = "warm:"
+_URLS_KEY = "urls"  # seen-URL count, so status never scans the store
+_SESSION_TTL = 24 * 3600
+
 
+def budget_message(count: int, previous: int | None = None) -> str:
+    """Return a budget message for the current call count.
 
-def budget_message(count: int) -> str:
-    """Return a budget message for the current call count."""
+    previous is the count before this reservation; a batch that jumps past
+    the checkpoint or warning threshold still gets that message.
+    """
+    if previous is None:
+        previous = count - 1
     remaining = MAX_CALLS - count
     counter = f"[budget: {count}/{MAX_CALLS} calls used, {remaining} remaining]"
 
@@ -30,7 +43,14 @@ def budget_message(count: int) -> str:
             "You MUST synthesize your answer NOW from what you have gathered.\n"
             "No more tool calls will be executed."
         )
-    if count == CHECKPOINT_AT:
+    if previous < WARNING_AT <= count:
+        return (
+            f"\n=== WARNING: {count}/{MAX_CALLS} calls used, "
+            f"{remaining} remaining ===\n"
+            "Synthesize your answer NOW. Do not launch another batch.\n"
+            "A later call requires --critical and one named blocking gap."
+        )
+    if previous < CHECKPOINT_AT <= count:
         return (
             f"\n=== CHECKPOINT: {count}/{MAX_CALLS} calls used, "
             f"{remaining} remaining ===\n"
@@ -38,73 +58,130 @@ def budget_message(count: int) -> str:
             "If yes, synthesize. If not, identify the ONE specific "
             "gap that remains."
         )
-    if count == WARNING_AT:
-        return (
-            f"\n=== WARNING: {count}/{MAX_CALLS} calls used, "
-            f"{remaining} remaining ===\n"
-            "Synthesize your answer NOW. Do not launch another batch.\n"
-            "A later call requires --critical and one named blocking gap."
-        )
     return f"\n{counter}"
 
 
 def _session_key(key: str) -> str | None:
     """Scope a budget key to the opt-in research session."""
-    from research._cache import get_session_id
-
     session_id = get_session_id()
     return f"budget:{session_id}:{key}" if session_id else None
 
 
+def _seen_keys(cached_url: str | Sequence[str] | None) -> list[str]:
+    """Return session seen-keys for one URL or a batch of URLs."""
+    if not cached_url:
+        return []
+    urls = [cached_url] if isinstance(cached_url, str) else list(dict.fromkeys(cached_url))
+    return [key for url in urls if (key := _session_key(f"{_SEEN_PREFIX}{url}"))]
+
+
+def _warm_key(url: str) -> str | None:
+    return _session_key(f"{_WARM_PREFIX}{cache_url(url)}")
+
+
+def mark_warmed(url: str) -> None:
+    """Flag a page this session's warmer cached as not yet paid for."""
+    key = _warm_key(url)
+    if key:
+        get_budget_store().set(key, True, expire=_SESSION_TTL)
+
+
+def is_warmed(url: str) -> bool:
+    """Return True if this session warmed a cached page and has not read it since."""
+    key = _warm_key(url)
+    return bool(key) and key in get_budget_store()
+
+
+def clear_warmed(url: str) -> None:
+    """Drop this session's warmed flag once the first read has been charged."""
+    key = _warm_key(url)
+    if key:
+        get_budget_store().delete(key)
+
+
+def _open_count(store: Cache, count_key: str, expire: float = _SESSION_TTL) -> None:
+    """Create a session counter with its expiry; a no-op once it exists."""
+    store.add(count_key, 0, expire=expire)
+
+
+def _session_ttl(store: Cache, count_key: str) -> float:
+    """Return the seconds left before the session's call counter expires.
+
+    Seen-URL keys and the URL counter expire with the call counter, so the
+    counter can never outlive or drift from the keys it counts.
+    """
+    _, expire_time = store.get(count_key, expire_time=True)
+    return max(expire_time - time.time(), 1.0) if expire_time else _SESSION_TTL
+
+
 def budget_reserve(
-    cache: Cache,
-    cached_url: str | None = None,
+    cached_url: str | Sequence[str] | None = None,
     critical: bool = False,
+    calls: int = 1,
 ) -> None:
-    """Reserve a budget slot and print the footer.
+    """Reserve budget slots and print the footer.
 
     Called BEFORE the tool performs any work so the printed counter reflects
-    invocation order. Parallel callers serialize inside cache.transact().
+    invocation order. The limit check and the reservation run in one budget
+    store transaction, so a batch that does not fit never touches the
+    counter or marks its URLs as seen, even briefly.
 
-    If cached_url was already seen this session, no slot is consumed.
+    cached_url may be a batch of URLs; the batch is reserved all-or-nothing,
+    one slot per URL not already seen this session. Without URLs, calls
+    slots are reserved at once (e.g. one per query of a multi-query search).
     On budget exhaustion, prints the message then exits 1.
     """
     count_key = _session_key(_COUNT_KEY)
     if count_key is None:
         return
-    seen_key = _session_key(f"{_SEEN_PREFIX}{cached_url}") if cached_url else None
-
-    with cache.transact():
-        count = cache.get(count_key, 0)
+    store = get_budget_store()
+    seen_keys = _seen_keys(cached_url)
+
+    with store.transact():
+        new_keys = [key for key in seen_keys if key not in store]
+        previous = store.get(count_key, 0)
+        slots = len(new_keys) if seen_keys else calls
+        count = previous + slots
+        fits = count <= MAX_CALLS and (count <= WARNING_AT or critical)
+        if slots and fits:
+            _open_count(store, count_key)
+            store.incr(count_key, slots)
+            if new_keys:
+                ttl = _session_ttl(store, count_key)
+                for key in new_keys:
+                    store.set(key, True, expire=ttl)
+                urls_key = _session_key(_URLS_KEY)
+                _open_count(store, urls_key, expire=ttl)
+                store.incr(urls_key, len(new_keys))
+
+    if not slots:
+        remaining = MAX_CALLS - previous
+        click.echo(
+            f"\n[cache hit; budget unchanged at {previous}/{MAX_CALLS} used, {remaining} remaining]"
+        )
+        return
 
-        if seen_key and seen_key in cache:
-            remaining = MAX_CALLS - count
+    if not fits:
+        if count > MAX_CALLS and previous < MAX_CALLS:
             click.echo(
-                f"\n[cache hit; budget unchanged at {count}/{MAX_CALLS} used, "
-                f"{remaining} remaining]"
+                f"\n=== BUDGET INSUFFICIENT ({previous}/{MAX_CALLS} calls used) ===\n"
+                f"This batch needs {slots} calls; only {MAX_CALLS - previous} remain.\n"
+                "Batch fewer URLs or queries, or synthesize from what you have gathered."
             )
-            return
-
-        if count >= MAX_CALLS:
+        elif count > MAX_CALLS:
             click.echo(budget_message(MAX_CALLS + 1))
-            sys.exit(1)
-
-        if count >= WARNING_AT and not critical:
+        else:
             click.echo(
-                f"\n=== CRITICAL RESERVE ({count}/{MAX_CALLS} calls used) ===\n"
-                f"The final {MAX_CALLS - count} calls are reserved. Synthesize now.\n"
+                f"\n=== CRITICAL RESERVE ({previous}/{MAX_CALLS} calls used) ===\n"
+                f"The final {MAX_CALLS - previous} calls are reserved. Synthesize now.\n"
                 "Use --critical for one specific gap that prevents an answer."
             )
-            sys.exit(1)
+        sys.exit(1)
 
-        count += 1
-        cache.set(count_key, count, expire=24 * 3600)
-        if seen_key:
-            cache.set(seen_key, True, expire=24 * 3600)
-        click.echo(budget_message(count))
+    click.echo(budget_message(count, previous))
 
 
-def budget_refund(cache: Cache, cached_url: str | None = None) -> None:
+def budget_refund(cached_url: str | None = None) -> None:
     """Return a budget slot after a failed tool call.
 
     Reverses a prior budget_reserve: decrements count and removes the seen
@@ -113,16 +190,19 @@ def budget_refund(cache: Cache, cached_url: str | None = None) -> None:
     count_key = _session_key(_COUNT_KEY)
     if count_key is None:
         return
+    store = get_budget_store()
+    if store.get(count_key, 0) <= 0:
+        return
+    count = store.decr(count_key)
+    if count < 0:
+        store.incr(count_key)
+        return
     seen_key = _session_key(f"{_SEEN_PREFIX}{cached_url}") if cached_url else None
-
-    with cache.transact():
-        count = cache.get(count_key, 0)
-        if count <= 0:
-            return
-        count -= 1
-        cache.set(count_key, count, expire=24 * 3600)
-        if seen_key and seen_key in cache:
-            cache.delete(seen_key)
+    if seen_key:
+        urls_key = _session_key(_URLS_KEY)
+        with store.transact():
+            if store.delete(seen_key) and store.get(urls_key, 0) > 0:
+                store.decr(urls_key)
 
     remaining = MAX_CALLS - count
     click.echo(
@@ -132,23 +212,23 @@ def budget_refund(cache: Cache, cached_url: str | None = None) -> None:
     )
 
 
-def get_count(cache: Cache) -> int:
+def get_count() -> int:
     """Return current call count."""
     count_key = _session_key(_COUNT_KEY)
-    return cache.get(count_key, 0) if count_key else 0
+    return get_budget_store().get(count_key, 0) if count_key else 0
 
 
-def format_status(cache: Cache) -> str:
+def format_status() -> str:
     """Return status string for status command."""
     count_key = _session_key(_COUNT_KEY)
     if count_key is None:
         return "No budget session active."
-    count = cache.get(count_key, 0)
+    store = get_budget_store()
+    count = store.get(count_key, 0)
     remaining = MAX_CALLS - count
     lines = [f"{count}/{MAX_CALLS} calls used, {remaining} remaining"]
-    seen_prefix = _session_key(_SEEN_PREFIX)
-    url_count = sum(1 for k in cache if isinstance(k, str) and k.startswith(seen_prefix or ""))
-    if url_count:
+    url_count = store.get(_session_key(_URLS_KEY), 0)
+    if url_count > 0:
         lines.append(f"cached URLs: {url_count}")
     if WARNING_AT <= count < MAX_CALLS:
         lines.append(f"critical reserve: {MAX_CALLS - count} calls")
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import atexit
 import contextlib
 import os
+import pickle
+import sqlite3
+import threading
 import time
-from collections.abc import Generator
+import zlib
+from collections.abc import Generator, Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlsplit, urlunsplit
@@ -15,12 +20,41 @@ import click
 if TYPE_CHECKING:
     from diskcache import Cache
 
+try:
+    from compression import zstd as _zstd  # Python 3.14+
+except ImportError:
+    _zstd = None
+
 _BASE_CACHE_DIR = Path("/tmp/.research-cache")
+_CONTENT_CACHE_DIR = _BASE_CACHE_DIR / "content"
+_PDF_DIR = _BASE_CACHE_DIR / "pdf"
+_BUDGET_DIR = _BASE_CACHE_DIR / "budget"
+_ERRORS_DIR = _BASE_CACHE_DIR / "errors"
 _CONTENT_PREFIX = "content:"
+_PDF_PREFIX = "pdf:"
+_INDEX_PREFIX = "index:"
+_PDF_PAGE_PREFIX = "pdfpage:"
 _SEARCH_PREFIX = "search:"
+_STATS_PREFIX = "stats:"
+_DB_NAME = "cache.db"  # diskcache's SQLite file inside each store directory
 _CACHE_TTL = 24 * 3600
+# Pages with ETag/Last-Modified validators outlive _CACHE_TTL so an expired
+# copy can be revalidated with a conditional request instead of re-extracted.
+_STALE_TTL = 7 * 24 * 3600
+
+# Byte cap for the content tier; least-recently-used pages are evicted past it.
+CONTENT_SIZE_LIMIT: int = int(os.environ.get("RESEARCH_CACHE_SIZE_LIMIT") or 512 * 2**20)
+# Byte cap for spooled PDFs; least-recently-used files are removed past it.
+PDF_SPOOL_LIMIT: int = int(os.environ.get("RESEARCH_PDF_SPOOL_LIMIT") or 1024 * 2**20)
+_CONTENT_CODEC = "zstd" if _zstd is not None else "zlib"
 
 _cache_singleton: Cache | _InMemoryCache | None = None
+_content_cache_singleton: Cache | _InMemoryCache | None = None
+_budget_store_singleton: Cache | _InMemoryCache | None = None
+
+# Statistic deltas gathered by this process, written by _flush_stats at exit.
+_pending_stats: dict[str, int] = {}
+_pending_stats_lock = threading.Lock()
 
 
 class _InMemoryCache:
@@ -29,22 +63,24 @@ class _InMemoryCache:
     def __init__(self) -> None:
         self._store: dict[str, tuple[Any, float | None]] = {}
 
-    def get(self, key: str, default: Any = None) -> Any:
+    def get(self, key: str, default: Any = None, expire_time: bool = False) -> Any:
         item = self._store.get(key)
-        if item is None:
-            return default
-        value, expires_at = item
-        if expires_at is None or expires_at > time.monotonic():
-            return value
-        self.delete(key)
-        return default
+        if item is not None:
+            value, expires_at = item
+            if expires_at is None or expires_at > time.monotonic():
+                if not expire_time:
+                    return value
+                wall = None if expires_at is None else time.time() + expires_at - time.monotonic()
+                return value, wall
+            self.delete(key)
+        return (default, None) if expire_time else default
 
     def set(self, key: str, value: Any, expire: int | None = None) -> None:
         expires_at = time.monotonic() + expire if expire is not None else None
         self._store[key] = (value, expires_at)
 
-    def delete(self, key: str) -> None:
-        self._store.pop(key, None)
+    def delete(self, key: str) -> bool:
+        return self._store.pop(key, None) is not None
 
     def __contains__(self, key: object) -> bool:
         return isinstance(key, str) and self.get(key) is not None
@@ -52,6 +88,24 @@ class _InMemoryCache:
     def __iter__(self):
         return iter([key for key in self._store if key in self])
 
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def add(self, key: str, value: Any, expire: int | None = None) -> bool:
+        if key in self:
+            return False
+        self.set(key, value, expire=expire)
+        return True
+
+    def incr(self, key: str, delta: int = 1, default: int = 0) -> int:
+        value = self.get(key, default) + delta
+        item = self._store.get(key)
+        self._store[key] = (value, item[1] if item else None)
+        return value
+
+    def decr(self, key: str, delta: int = 1, default: int = 0) -> int:
+        return self.incr(key, -delta, default)
+
     @contextlib.contextmanager
     def transact(self) -> Generator[None, None, None]:
         yield
@@ -71,6 +125,113 @@ def get_cache() -> Cache | _InMemoryCache:
     return _cache_singleton
 
 
+def get_content_cache() -> Cache | _InMemoryCache:
+    """Return the size-bounded content tier, falling back to memory if it cannot open.
+
+    Fetched pages live apart from budget and search entries so LRU eviction
+    can never drop session counters.
+    """
+    global _content_cache_singleton
+    if _content_cache_singleton is None:
+        try:
+            from diskcache import Cache as _Cache
+
+            _content_cache_singleton = _Cache(
+                str(_CONTENT_CACHE_DIR),
+                size_limit=CONTENT_SIZE_LIMIT,
+                eviction_policy="least-recently-used",
+            )
+        except Exception:  # noqa: BLE001
+            click.echo("[warning: content cache unavailable; using in-memory fallback]", err=True)
+            _content_cache_singleton = _InMemoryCache()
+    return _content_cache_singleton
+
+
+def get_budget_store() -> Cache | _InMemoryCache:
+    """Return the small store for session budget counters and seen-URL keys.
+
+    It is a separate SQLite file so budget checks never wait behind
+    multi-megabyte content writes to the shared cache.
+    """
+    global _budget_store_singleton
+    if _budget_store_singleton is None:
+        try:
+            from diskcache import Cache as _Cache
+
+            _budget_store_singleton = _Cache(str(_BUDGET_DIR))
+        except Exception:  # noqa: BLE001
+            click.echo("[warning: budget store unavailable; using in-memory fallback]", err=True)
+            _budget_store_singleton = _InMemoryCache()
+    return _budget_store_singleton
+
+
+def _bump_stat(name: str, delta: int = 1) -> None:
+    """Add delta to a lifetime cache statistic.
+
+    Deltas stay in memory until the process exits, so cache lookups never
+    write to the shared store; _flush_stats adds them in one transaction.
+    """
+    with _pending_stats_lock:
+        if not _pending_stats:
+            atexit.register(_flush_stats)
+        _pending_stats[name] = _pending_stats.get(name, 0) + delta
+
+
+def _flush_stats() -> None:
+    """Write this process's statistic deltas; statistics never fail a command."""
+    with _pending_stats_lock:
+        pending = dict(_pending_stats)
+        _pending_stats.clear()
+    if not pending:
+        return
+    with contextlib.suppress(Exception):
+        cache = get_cache()
+        with cache.transact():
+            for name, delta in pending.items():
+                cache.incr(f"{_STATS_PREFIX}{name}", delta)
+
+
+def get_stat(name: str) -> int:
+    """Return a lifetime cache statistic, including this process's unwritten deltas."""
+    value = get_cache().get(f"{_STATS_PREFIX}{name}", 0)
+    with _pending_stats_lock:
+        pending = _pending_stats.get(name, 0)
+    return (value if isinstance(value, int) else 0) + pending
+
+
+def _compress_bytes(raw: bytes) -> bytes:
+    if _zstd is not None:
+        return _zstd.compress(raw)
+    return zlib.compress(raw, 6)
+
+
+def _compress(text: str) -> bytes:
+    return _compress_bytes(text.encode())
+
+
+def _decompress_bytes(codec: str, data: bytes) -> bytes | None:
+    """Return decompressed bytes, or None when the codec is unavailable or data is corrupt."""
+    try:
+        if codec == "zstd" and _zstd is not None:
+            return _zstd.decompress(data)
+        if codec == "zlib":
+            return zlib.decompress(data)
+    except Exception:  # noqa: BLE001
+        return None
+    return None
+
+
+def _decompress(codec: str, data: bytes) -> str | None:
+    """Return decoded text, or None when the codec is unavailable or data is corrupt."""
+    raw = _decompress_bytes(codec, data)
+    if raw is None:
+        return None
+    try:
+        return raw.decode()
+    except UnicodeDecodeError:
+        return None
+
+
 def get_session_id() -> str | None:
     """Return the opt-in budget session identifier, if supplied."""
     return os.environ.get("OPENCODE_SESSION_ID") or None
@@ -82,25 +243,477 @@ def cache_url(url: str) -> str:
     return urlunsplit((parsed.scheme, parsed.netloc, parsed.path, parsed.query, ""))
 
 
+def _content_key(url: str) -> str:
+    return f"{_CONTENT_PREFIX}{cache_url(url)}"
+
+
+def _is_fresh(record: object) -> bool:
+    return isinstance(record, dict) and record.get("fresh_until", float("inf")) > time.time()
+
+
 def read_cached_content(url: str) -> str | None:
-    """Return cached markdown for a URL, or None if unseen."""
-    cache = get_cache()
-    value = cache.get(f"{_CONTENT_PREFIX}{cache_url(url)}")
-    return value if isinstance(value, str) else None
+    """Return cached markdown for a URL, or None if unseen or past its TTL."""
+    record = get_content_cache().get(_content_key(url))
+    if not _is_fresh(record):
+        _bump_stat("content:misses")
+        return None
+    _bump_stat("content:hits")
+    return _decompress(record.get("codec", ""), record.get("data", b""))
 
 
-def write_cached_content(url: str, content: str) -> None:
-    """Persist fetched markdown so repeat fetches skip the network."""
-    cache = get_cache()
-    cache.set(f"{_CONTENT_PREFIX}{cache_url(url)}", content, expire=_CACHE_TTL)
+def read_stale_content(url: str) -> tuple[str, dict[str, str]] | None:
+    """Return expired markdown and its HTTP validators for revalidation."""
+    record = get_content_cache().get(_content_key(url))
+    if not isinstance(record, dict) or not record.get("validators"):
+        return None
+    content = _decompress(record.get("codec", ""), record.get("data", b""))
+    return (content, dict(record["validators"])) if content is not None else None
+
+
+def is_content_cached(url: str) -> bool:
+    """Return True if fresh markdown for a URL is cached, without decoding it."""
+    return _is_fresh(get_content_cache().get(_content_key(url)))
+
+
+def _store_record(key: str, record: dict[str, Any]) -> None:
+    """Write a content record, counting entries the size cap evicted."""
+    cache = get_content_cache()
+    record["fresh_until"] = time.time() + _CACHE_TTL
+    before = len(cache)
+    is_new = key not in cache
+    cache.set(key, record, expire=_STALE_TTL if record.get("validators") else _CACHE_TTL)
+    evicted = before + int(is_new) - len(cache)
+    if evicted > 0:
+        _bump_stat("content:evictions", evicted)
+
+
+def write_cached_content(
+    url: str,
+    content: str,
+    validators: dict[str, str] | None = None,
+    headings: list[tuple[int, str, int]] | None = None,
+) -> None:
+    """Persist fetched markdown compressed so repeat fetches skip the network.
+
+    validators are the response's ETag/Last-Modified headers, kept so the
+    page can be revalidated once it expires. The heading outline is extracted
+    here once so --outline and --section never rescan the document, unless
+    the caller supplies one (a PDF's bookmarks).
+    """
+    from research._index import extract_headings
+
+    data = _compress(content)
+    record = {
+        "codec": _CONTENT_CODEC,
+        "data": data,
+        "size": len(content.encode()),
+        "validators": validators or {},
+        "headings": extract_headings(content) if headings is None else headings,
+    }
+    _store_record(_content_key(url), record)
+    _bump_stat("content:raw_bytes", record["size"])
+    _bump_stat("content:stored_bytes", len(data))
+    _write_index(url, content)
+
+
+def _write_index(url: str, content: str) -> None:
+    """Store the --find paragraph index, compressed, next to a long document."""
+    from research._index import INDEX_MIN_CHARS, build_index
+
+    key = f"{_INDEX_PREFIX}{cache_url(url)}"
+    if len(content) < INDEX_MIN_CHARS:
+        get_content_cache().delete(key)
+        return
+    data = _compress_bytes(pickle.dumps(build_index(content), pickle.HIGHEST_PROTOCOL))
+    get_content_cache().set(key, {"codec": _CONTENT_CODEC, "data": data}, expire=_STALE_TTL)
+
+
+def read_cached_index(url: str) -> dict[str, Any] | None:
+    """Return the paragraph index stored with a cached document, if any.
+
+    Indexes written before they were compressed read as missing, so --find
+    scans the document until it is cached again.
+    """
+    record = get_content_cache().get(f"{_INDEX_PREFIX}{cache_url(url)}")
+    if not isinstance(record, dict) or "codec" not in record:
+        return None
+    raw = _decompress_bytes(record["codec"], record.get("data", b""))
+    if raw is None:
+        return None
+    try:
+        index = pickle.loads(raw)
+    except Exception:  # noqa: BLE001
+        return None
+    return index if isinstance(index, dict) else None
+
+
+def read_cached_headings(url: str) -> list[tuple[int, str, int]] | None:
+    """Return the (level, title, offset) outline stored with cached markdown."""
+    record = get_content_cache().get(_content_key(url))
+    if not isinstance(record, dict) or "headings" not in record:
+        return None
+    return list(record["headings"])
+
+
+def refresh_cached_content(url: str) -> None:
+    """Restart the TTL of a cached page after a 304 Not Modified."""
+    key = _content_key(url)
+    record = get_content_cache().get(key)
+    if isinstance(record, dict):
+        _store_record(key, record)
+
+
+def pdf_spool_dir() -> Path:
+    """Return the directory holding content-addressed PDF downloads."""
+    _PDF_DIR.mkdir(parents=True, exist_ok=True)
+    return _PDF_DIR
+
+
+def store_pdf(url: str, spool: Path, digest: str) -> Path:
+    """Move a downloaded PDF to its content-addressed path and map the URL to it."""
+    path = pdf_spool_dir() / f"{digest}.pdf"
+    os.replace(spool, path)
+    get_content_cache().set(f"{_PDF_PREFIX}{cache_url(url)}", digest, expire=_STALE_TTL)
+    _trim_pdf_spool(PDF_SPOOL_LIMIT, keep=path)
+    return path
+
+
+def _spooled_pdfs() -> list[tuple[os.stat_result, Path]]:
+    """Return (stat, path) of every spooled PDF, least recently used first."""
+    files = []
+    for path in _PDF_DIR.glob("*.pdf"):
+        with contextlib.suppress(OSError):
+            files.append((path.stat(), path))
+    return sorted(files, key=lambda item: item[0].st_mtime)
+
+
+def _trim_pdf_spool(limit: int, keep: Path | None = None) -> int:
+    """Remove stale and least recently used spooled PDFs; return the count.
+
+    A PDF unused for as long as its URL mapping lives is always removed; the
+    rest go oldest first until the spool fits limit. A PDF's mtime is its
+    last use, since read_cached_pdf touches it.
+    """
+    files = _spooled_pdfs()
+    cutoff = time.time() - _STALE_TTL
+    total = sum(stat.st_size for stat, _ in files)
+    removed = 0
+    for stat, path in files:
+        if stat.st_mtime >= cutoff and total <= limit:
+            break
+        if path == keep:
+            continue
+        with contextlib.suppress(OSError):
+            path.unlink()
+            total -= stat.st_size
+            removed += 1
+    return removed
+
+
+def read_cached_pdf(url: str) -> Path | None:
+    """Return the local copy of a previously downloaded PDF, if still present."""
+    digest = get_content_cache().get(f"{_PDF_PREFIX}{cache_url(url)}")
+    if not isinstance(digest, str):
+        return None
+    path = _PDF_DIR / f"{digest}.pdf"
+    try:
+        os.utime(path)  # mark as recently used for _trim_pdf_spool
+    except OSError:
+        return None
+    return path
+
+
+def read_cached_pdf_pages(digest: str, pages: Iterable[int]) -> dict[int, str]:
+    """Return the cached markdown of each requested page of a PDF, by content hash."""
+    cache = get_content_cache()
+    found: dict[int, str] = {}
+    for number in pages:
+        record = cache.get(f"{_PDF_PAGE_PREFIX}{digest}:{number}")
+        if isinstance(record, dict):
+            text = _decompress(record.get("codec", ""), record.get("data", b""))
+            if text is not None:
+                found[number] = text
+    return found
+
+
+def read_cached_pdf_page_count(digest: str) -> int | None:
+    """Return the page count recorded when pages of a PDF were last converted."""
+    value = get_content_cache().get(f"{_PDF_PAGE_PREFIX}{digest}:count")
+    return value if isinstance(value, int) else None
+
+
+def read_cached_pdf_outline(digest: str) -> list[tuple[int, str, int]] | None:
+    """Return the (level, title, page) bookmarks recorded for a PDF, if any."""
+    value = get_content_cache().get(f"{_PDF_PAGE_PREFIX}{digest}:outline")
+    return [tuple(entry) for entry in value] if isinstance(value, list) else None
+
+
+def write_cached_pdf_pages(
+    digest: str,
+    pages: dict[int, str],
+    page_count: int,
+    outline: list[tuple[int, str, int]] | None = None,
+) -> None:
+    """Cache converted PDF pages one entry each, keyed by PDF hash and page number.
+
+    The hash names the PDF's bytes, so a page never goes stale; entries only
+    age out with the content tier. outline is the PDF's bookmark list.
+    """
+    cache = get_content_cache()
+    for number, text in pages.items():
+        record = {"codec": _CONTENT_CODEC, "data": _compress(text)}
+        cache.set(f"{_PDF_PAGE_PREFIX}{digest}:{number}", record, expire=_STALE_TTL)
+    cache.set(f"{_PDF_PAGE_PREFIX}{digest}:count", page_count, expire=_STALE_TTL)
+    if outline is not None:
+        cache.set(f"{_PDF_PAGE_PREFIX}{digest}:outline", list(outline), expire=_STALE_TTL)
+
+
+def normalize_query(query: str) -> str:
+    """Return a search query's cache identity: case-folded, whitespace collapsed."""
+    return " ".join(query.casefold().split())
 
 
 def read_cached_search(key: str) -> str | None:
     """Return a shared cached search rendering, if available."""
     value = get_cache().get(f"{_SEARCH_PREFIX}{key}")
+    _bump_stat("search:hits" if isinstance(value, str) else "search:misses")
     return value if isinstance(value, str) else None
 
 
 def write_cached_search(key: str, content: str) -> None:
     """Cache a rendered search response for all callers for 24 hours."""
     get_cache().set(f"{_SEARCH_PREFIX}{key}", content, expire=_CACHE_TTL)
+
+
+def _results_key(query: str) -> str:
+    return f"{_SEARCH_PREFIX}results:{normalize_query(query)}"
+
+
+def read_cached_results(query: str, max_results: int) -> list[dict[str, Any]] | None:
+    """Return cached raw search results, sliced from any response at least as large.
+
+    A response fetched with --max-results 10 serves every smaller request for
+    the same query.
+    """
+    entry = get_cache().get(_results_key(query))
+    if not isinstance(entry, dict) or entry.get("max_results", 0) < max_results:
+        _bump_stat("search:misses")
+        return None
+    _bump_stat("search:hits")
+    return list(entry["results"][:max_results])
+
+
+def write_cached_results(query: str, max_results: int, results: list[dict[str, Any]]) -> None:
+    """Cache raw search results unless a larger response for the query is cached."""
+    cache = get_cache()
+    key = _results_key(query)
+    entry = cache.get(key)
+    if isinstance(entry, dict) and entry.get("max_results", 0) > max_results:
+        return
+    cache.set(key, {"max_results": max_results, "results": results}, expire=_CACHE_TTL)
+
+
+def search_stats() -> dict[str, int]:
+    """Return lifetime search cache hits, misses, and paid Linkup calls."""
+    return {
+        "hits": get_stat("search:hits"),
+        "misses": get_stat("search:misses"),
+        "paid": get_stat("search:paid"),
+    }
+
+
+def content_stats() -> dict[str, int]:
+    """Return content-tier size, compression, and eviction totals."""
+    cache = get_content_cache()
+    volume = getattr(cache, "volume", None)
+    return {
+        "entries": len(cache),
+        "volume": volume() if volume else 0,
+        "limit": CONTENT_SIZE_LIMIT,
+        "raw_bytes": get_stat("content:raw_bytes"),
+        "stored_bytes": get_stat("content:stored_bytes"),
+        "evictions": get_stat("content:evictions"),
+        "hits": get_stat("content:hits"),
+        "misses": get_stat("content:misses"),
+    }
+
+
+_PREFIX_STATS_SQL = """
+SELECT CASE WHEN instr(key, ':') THEN substr(key, 1, instr(key, ':')) ELSE key END,
+       COUNT(*), SUM(size + IFNULL(length(value), 0)), MIN(store_time), MAX(store_time)
+FROM Cache WHERE expire_time IS NULL OR expire_time > ?
+GROUP BY 1 ORDER BY 1
+"""
+
+
+def _stores() -> dict[str, Cache | _InMemoryCache]:
+    return {"shared": get_cache(), "content": get_content_cache(), "budget": get_budget_store()}
+
+
+def _read_only(cache: Cache | _InMemoryCache) -> contextlib.closing[sqlite3.Connection] | None:
+    """Open a store's SQLite file read-only for aggregate queries; None for memory."""
+    directory = getattr(cache, "directory", None)
+    if directory is None:
+        return None
+    uri = f"file:{Path(directory) / _DB_NAME}?mode=ro"
+    return contextlib.closing(sqlite3.connect(uri, uri=True, timeout=5))
+
+
+def prefix_stats() -> list[dict[str, Any]]:
+    """Return live entries, bytes, and store-time range per store and key prefix.
+
+    One grouped query per SQLite file, so no entry is ever deserialized.
+    """
+    rows: list[dict[str, Any]] = []
+    for store, cache in _stores().items():
+        connection = _read_only(cache)
+        if connection is None:
+            continue
+        with connection as db:
+            for prefix, entries, size, oldest, newest in db.execute(
+                _PREFIX_STATS_SQL, (time.time(),)
+            ):
+                rows.append(
+                    {
+                        "store": store,
+                        "prefix": prefix,
+                        "entries": entries,
+                        "bytes": size or 0,
+                        "oldest": oldest,
+                        "newest": newest,
+                    }
+                )
+    return rows
+
+
+def file_stats(directory: Path, pattern: str) -> dict[str, Any]:
+    """Return the count, bytes, and oldest/newest mtime of files matching pattern."""
+    stats = []
+    for path in directory.glob(pattern):
+        with contextlib.suppress(OSError):
+            stats.append(path.stat())
+    return {
+        "entries": len(stats),
+        "bytes": sum(stat.st_size for stat in stats),
+        "oldest": min((stat.st_mtime for stat in stats), default=None),
+        "newest": max((stat.st_mtime for stat in stats), default=None),
+    }
+
+
+def _unlink_older_than(directory: Path, pattern: str, cutoff: float) -> int:
+    removed = 0
+    for path in directory.glob(pattern):
+        with contextlib.suppress(OSError):
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def prune_older_than(max_age: float) -> int:
+    """Delete cached pages, searches, and PDFs stored more than max_age seconds ago.
+
+    Lifetime statistics and the budget store are left alone; session counters
+    expire on their own. Returns the number of entries and files removed.
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+    for cache in (get_cache(), get_content_cache()):
+        connection = _read_only(cache)
+        if connection is None:
+            continue
+        removed += cache.expire()
+        with connection as db:
+            keys = [
+                key
+                for (key,) in db.execute(
+                    "SELECT key FROM Cache WHERE store_time < ? AND key NOT LIKE ?",
+                    (cutoff, f"{_STATS_PREFIX}%"),
+                )
+            ]
+        removed += sum(bool(cache.delete(key)) for key in keys)
+    removed += _unlink_older_than(_PDF_DIR, "*.pdf", cutoff)
+    removed += _unlink_older_than(_ERRORS_DIR, "*.jsonl", cutoff)
+    return removed
+
+
+def _evict_oldest(cache: Cache | _InMemoryCache, nbytes: int, pattern: str) -> tuple[int, int]:
+    """Delete LIKE-pattern entries, least recently used first, until nbytes are freed.
+
+    Returns (entries, bytes) removed, with bytes measured as in prefix_stats.
+    """
+    connection = _read_only(cache)
+    if connection is None or nbytes <= 0:
+        return 0, 0
+    with connection as db:
+        rows = db.execute(
+            "SELECT key, size + IFNULL(length(value), 0) FROM Cache"
+            " WHERE key LIKE ? ORDER BY access_time",
+            (pattern,),
+        ).fetchall()
+    removed = freed = 0
+    for key, size in rows:
+        if freed >= nbytes:
+            break
+        if cache.delete(key):
+            removed += 1
+            freed += size
+    return removed, freed
+
+
+def evict_content(nbytes: int) -> tuple[int, int]:
+    """Free nbytes of the content tier, least recently used entries first."""
+    return _evict_oldest(get_content_cache(), nbytes, "%")
+
+
+def evict_searches(nbytes: int) -> tuple[int, int]:
+    """Free nbytes of cached search responses, oldest first."""
+    return _evict_oldest(get_cache(), nbytes, f"{_SEARCH_PREFIX}%")
+
+
+def evict_pdfs(nbytes: int) -> tuple[int, int]:
+    """Free nbytes of spooled PDFs, least recently used first."""
+    removed = freed = 0
+    for stat, path in _spooled_pdfs():
+        if freed >= nbytes:
+            break
+        with contextlib.suppress(OSError):
+            path.unlink()
+            removed += 1
+            freed += stat.st_size
+    return removed, freed
+
+
+def vacuum_stores() -> list[tuple[str, int, int]]:
+    """Drop expired entries and VACUUM each SQLite store; return (store, before, after) sizes."""
+    sizes = []
+    for store, cache in _stores().items():
+        directory = getattr(cache, "directory", None)
+        if directory is None:
+            continue
+        cache.expire()
+        path = Path(directory) / _DB_NAME
+        before = path.stat().st_size
+        with contextlib.closing(sqlite3.connect(path, timeout=60)) as db:
+            db.execute("VACUUM")
+            db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        sizes.append((store, before, path.stat().st_size))
+    return sizes
+
+
+def drop_cached_url(url: str) -> int:
+    """Remove a URL's page, index, and PDF pages; return entries removed."""
+    identity = cache_url(url)
+    content = get_content_cache()
+    digest = content.get(f"{_PDF_PREFIX}{identity}")
+    keys = [_content_key(url), f"{_INDEX_PREFIX}{identity}", f"{_PDF_PREFIX}{identity}"]
+    if isinstance(digest, str):
+        page_count = read_cached_pdf_page_count(digest) or 0
+        keys += [f"{_PDF_PAGE_PREFIX}{digest}:{number}" for number in range(1, page_count + 1)]
+        keys += [f"{_PDF_PAGE_PREFIX}{digest}:count", f"{_PDF_PAGE_PREFIX}{digest}:outline"]
+    removed = sum(bool(content.delete(key)) for key in keys)
+    if isinstance(digest, str):
+        with contextlib.suppress(FileNotFoundError):
+            (_PDF_DIR / f"{digest}.pdf").unlink()
+            removed += 1
+    return removed
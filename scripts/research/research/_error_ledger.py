@@ -1,52 +1,137 @@
-"""Persistent per-session tool failure ledger."""
+"""Persistent per-session tool failure ledger.
+
+Each session appends one JSON line per failure to its own file, so recording
+never rereads or rewrites earlier entries. Only the tail of a command's output
+is kept for the ledger, so large dumps are never copied in full.
+"""
 
 from __future__ import annotations
 
 import contextlib
+import fcntl
+import json
+import os
+import re
 import shlex
 import sys
+import time
+from collections import deque
 from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any, TextIO
 
-_ERRORS_KEY = "errors"
 _EXPIRY_SECONDS = 24 * 3600
+_TAIL_CHARS: int = max(int(os.environ.get("RESEARCH_ERROR_TAIL_KB") or 16), 1) * 1024
+_UNSAFE_RE = re.compile(r"[^\w.-]")
 
 
-def _session_key() -> str | None:
-    from research._cache import get_session_id
+def _ledger_path() -> Path | None:
+    from research._cache import _ERRORS_DIR, get_session_id
 
     session_id = get_session_id()
-    return f"research:{session_id}:{_ERRORS_KEY}" if session_id else None
+    return _ERRORS_DIR / f"{_UNSAFE_RE.sub('_', session_id)}.jsonl" if session_id else None
+
+
+def _prune_expired(directory: Path) -> None:
+    """Delete ledgers of sessions idle for longer than the expiry."""
+    cutoff = time.time() - _EXPIRY_SECONDS
+    for ledger in directory.glob("*.jsonl"):
+        with contextlib.suppress(OSError):
+            if ledger.stat().st_mtime < cutoff:
+                ledger.unlink()
 
 
 def record_error(arguments: list[str], message: str) -> None:
     """Append one failed invocation to the active session ledger."""
-    from research._cache import get_cache
-
-    key = _session_key()
-    if key is None:
+    path = _ledger_path()
+    if path is None:
         return
-    command = shlex.join(["research", *arguments])
-    entry = f"Tool: research\nInput: {command}\nError:\n{message.strip()}"
-    cache = get_cache()
-    with cache.transact():
-        entries = list(cache.get(key, []))
-        entries.append(entry)
-        cache.set(key, entries, expire=_EXPIRY_SECONDS)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        _prune_expired(path.parent)
+    entry = {
+        "time": datetime.now(UTC).isoformat(timespec="seconds"),
+        "input": shlex.join(["research", *arguments]),
+        "error": message.strip(),
+    }
+    with open(path, "a", encoding="utf-8") as ledger:
+        fcntl.flock(ledger.fileno(), fcntl.LOCK_EX)
+        try:
+            ledger.write(json.dumps(entry) + "\n")
+        finally:
+            fcntl.flock(ledger.fileno(), fcntl.LOCK_UN)
+
+
+def _read_entries() -> list[dict[str, str]]:
+    path = _ledger_path()
+    if path is None:
+        return []
+    try:
+        with open(path, encoding="utf-8") as ledger:
+            lines = ledger.readlines()
+    except FileNotFoundError:
+        return []
+    entries = []
+    for line in lines:
+        with contextlib.suppress(json.JSONDecodeError):
+            entries.append(json.loads(line))
+    return entries
 
 
 def get_errors() -> list[str]:
     """Return all failures recorded for the active session."""
-    from research._cache import get_cache
+    return [
+        f"Time: {entry['time']}\nTool: research\nInput: {entry['input']}\nError:\n{entry['error']}"
+        for entry in _read_entries()
+    ]
 
-    key = _session_key()
-    if key is None:
-        return []
-    return list(get_cache().get(key, []))
+
+def count_errors() -> int:
+    """Return the number of failures recorded for the active session."""
+    path = _ledger_path()
+    if path is None:
+        return 0
+    try:
+        with open(path, "rb") as ledger:
+            return sum(1 for line in ledger if line.strip())
+    except FileNotFoundError:
+        return 0
+
+
+class _TailBuffer:
+    """Keep only the last `limit` characters written."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._chunks: deque[str] = deque()
+        self._size = 0
+        self._dropped = False
+
+    def write(self, text: str) -> int:
+        written = len(text)
+        if written > self._limit:
+            text = text[-self._limit :]
+            self._dropped = True
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size - len(self._chunks[0]) >= self._limit:
+            self._size -= len(self._chunks.popleft())
+            self._dropped = True
+        # getvalue() also slices anything past the limit off the head chunk.
+        self._dropped = self._dropped or self._size > self._limit
+        return written
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        text = "".join(self._chunks)[-self._limit :]
+        return f"[... earlier output omitted]\n{text}" if self._dropped else text
 
 
 class _TeeStream:
-    def __init__(self, target: TextIO, recorder: TextIO) -> None:
+    def __init__(self, target: TextIO, recorder: _TailBuffer) -> None:
         self._target = target
         self._recorder = recorder
 
@@ -63,12 +148,10 @@ class _TeeStream:
 
 
 def run_with_error_ledger(command: Callable[[], Any]) -> None:
-    """Run the root CLI and persist its output when the invocation fails."""
-    from io import StringIO
-
+    """Run the root CLI and persist its output tail when the invocation fails."""
     original_stdout = sys.stdout
     original_stderr = sys.stderr
-    recorder = StringIO()
+    recorder = _TailBuffer(_TAIL_CHARS)
     sys.stdout = _TeeStream(original_stdout, recorder)
     sys.stderr = _TeeStream(original_stderr, recorder)
     try:
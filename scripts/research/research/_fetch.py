@@ -2,21 +2,43 @@
 
 from __future__ import annotations
 
-import re
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
 import time
+from dataclasses import dataclass, field
+from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 
 import click
 import trafilatura
-from curl_cffi.requests import get as _http_get
+from curl_cffi import CurlInfo, CurlOpt
+from curl_cffi.curl import CURL_WRITEFUNC_ERROR
+from curl_cffi.requests import Session
 from curl_cffi.requests.exceptions import ConnectionError as _CurlConnError
 from curl_cffi.requests.exceptions import RequestException, Timeout
-from lxml import html as lxml_html
+from lxml.html import HtmlElement
 
 from research._browser import fetch_with_browser
+from research._cache import get_cache, pdf_spool_dir, store_pdf
 
 _TIMEOUT = 15.0
+# PDF downloads have no total time limit (a 200 MiB file can take minutes);
+# they fail only when the transfer stalls below 1 byte/s for this long,
+# matching the per-read timeout pdf2md used to apply.
+_PDF_STALL_SECONDS = 30
+_PDF_CURL_OPTIONS = {
+    CurlOpt.CONNECTTIMEOUT_MS: int(_TIMEOUT * 1000),
+    CurlOpt.LOW_SPEED_LIMIT: 1,
+    CurlOpt.LOW_SPEED_TIME: _PDF_STALL_SECONDS,
+}
 _RETRY_DELAY = 1.5  # seconds before retry attempt
+# Byte cap for page bodies; larger responses are cut off and extracted as-is.
+_MAX_BODY_BYTES: int = int(os.environ.get("RESEARCH_FETCH_MAX_BYTES") or 10 * 2**20)
+# PDFs are spooled to disk for `research pdf` rather than held in memory.
+_MAX_PDF_BYTES: int = int(os.environ.get("RESEARCH_PDF_MAX_BYTES") or 200 * 2**20)
 
 # Content-Type prefixes that indicate a binary/file response, not a web page.
 _FILE_CONTENT_TYPES = (
@@ -60,13 +82,45 @@ _CHALLENGE_BODY_MARKERS = (
 )
 _CHALLENGE_BODY_MAX_CHARS = 50_000
 
-_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+# Per-host strategy memory: +1 each time a browser render extracted content,
+# -1 each time static extraction worked or a render failed. The score halves
+# every _HOST_HALF_LIFE so hosts that change behaviour are re-probed; past
+# +_HOST_THRESHOLD the host goes straight to the browser.
+_HOST_PREFIX = "host:"
+_HOST_HALF_LIFE = 3 * 24 * 3600
+_HOST_THRESHOLD = 1.5  # two consistent outcomes in a row, allowing for decay
+_HOST_SCORE_LIMIT = 5.0
+_HOST_TTL = 30 * 24 * 3600
+
+# Response validator header -> conditional request header that replays it.
+_VALIDATOR_HEADERS = {"etag": "If-None-Match", "last-modified": "If-Modified-Since"}
+
+_local = threading.local()
 
 
 class FetchError(Exception):
     """HTTP fetch or content extraction failed."""
 
 
+class FileResponseError(FetchError):
+    """The URL serves a file; path is the spooled PDF when it was one."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        super().__init__("URL serves a file, not an HTML page; try `research pdf URL` instead")
+        self.path = path
+
+
+@dataclass
+class FetchedPage:
+    """Extracted page content and the validators to revalidate it later.
+
+    markdown is None when a conditional request got 304 Not Modified.
+    """
+
+    markdown: str | None
+    validators: dict[str, str] = field(default_factory=dict)
+
+
 def _is_reddit(url: str) -> bool:
     return urlparse(url).hostname in _REDDIT_HOSTS
 
@@ -79,24 +133,67 @@ def _to_old_reddit(url: str) -> str:
     return url
 
 
-def _is_challenge_page(text: str) -> bool:
-    """Return True if the response body looks like a bot-challenge page."""
-    match = _TITLE_RE.search(text)
-    if match:
-        title = match.group(1).lower()
-        if any(marker in title for marker in _CHALLENGE_TITLE_MARKERS):
-            return True
+def _parse_html(text: str) -> HtmlElement | None:
+    """Parse a document once for challenge checks, Reddit, and trafilatura.
+
+    Uses trafilatura's own loader so the tree matches what extract() would
+    have built from the string.
+    """
+    return trafilatura.load_html(text)
+
+
+def _is_challenge_page(tree: HtmlElement | None, text: str) -> bool:
+    """Return True if a parsed response looks like a bot-challenge page."""
+    title = (tree.findtext(".//title") or "") if tree is not None else ""
+    if any(marker in title.lower() for marker in _CHALLENGE_TITLE_MARKERS):
+        return True
     if len(text) > _CHALLENGE_BODY_MAX_CHARS:
         return False
     lower = text.lower()
     return any(marker in lower for marker in _CHALLENGE_BODY_MARKERS)
 
 
-def _extract_reddit(html_text: str) -> str:
-    """Extract post and comments from old.reddit.com HTML as markdown."""
-    try:
-        tree = lxml_html.fromstring(html_text)
-    except Exception:  # noqa: BLE001
+def _extract_markdown(tree: HtmlElement | None) -> str | None:
+    """Run trafilatura on an already parsed document."""
+    if tree is None:
+        return None
+    return trafilatura.extract(
+        tree,
+        output_format="markdown",
+        include_links=True,
+        include_tables=True,
+    )
+
+
+def _host_score(host: str) -> float:
+    """Return the decayed browser-vs-static score recorded for a host."""
+    record = get_cache().get(f"{_HOST_PREFIX}{host}")
+    if not isinstance(record, dict):
+        return 0.0
+    age = max(0.0, time.time() - record.get("at", 0.0))
+    return record.get("score", 0.0) * 0.5 ** (age / _HOST_HALF_LIFE)
+
+
+def _host_strategy(host: str) -> str | None:
+    """Return "browser" or "static" once a host's outcomes are consistent."""
+    score = _host_score(host)
+    if score >= _HOST_THRESHOLD:
+        return "browser"
+    if score <= -_HOST_THRESHOLD:
+        return "static"
+    return None
+
+
+def _record_host(host: str, needed_browser: bool) -> None:
+    """Fold one fetch outcome into the host's decayed score."""
+    delta = 1.0 if needed_browser else -1.0
+    score = max(-_HOST_SCORE_LIMIT, min(_HOST_SCORE_LIMIT, _host_score(host) + delta))
+    get_cache().set(f"{_HOST_PREFIX}{host}", {"score": score, "at": time.time()}, expire=_HOST_TTL)
+
+
+def _extract_reddit(tree: HtmlElement | None) -> str:
+    """Extract post and comments from parsed old.reddit.com HTML as markdown."""
+    if tree is None:
         return ""
     parts: list[str] = []
 
@@ -129,104 +226,267 @@ def _extract_reddit(html_text: str) -> str:
     return "\n\n".join(parts)
 
 
-def _fetch_response(url: str) -> object:
-    """Fetch URL and return response; raises FetchError on failure.
+def _is_file_type(content_type: str) -> bool:
+    return any(content_type.startswith(t) for t in _FILE_CONTENT_TYPES)
+
+
+class _BodySink:
+    """curl write callback that streams a response body under a byte cap.
+
+    The decision is made when the first chunk arrives, from the Content-Type
+    header and the chunk itself: PDFs are spooled to disk and hashed for the
+    PDF pipeline, other file responses abort the transfer at once instead of
+    being downloaded in full.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._chunks: list[bytes] = []
+        self._size = 0
+        self._started = False
+        self._spool: tempfile._TemporaryFileWrapper[bytes] | None = None
+        self._digest = hashlib.sha256()
+        self.aborted: str | None = None  # "file", "truncated", or "too large"
+
+    def __call__(self, chunk: bytes) -> int:
+        if not self._started:
+            self._started = True
+            raw_type = self._session.curl.getinfo(CurlInfo.CONTENT_TYPE) or b""
+            content_type = raw_type.decode(errors="replace")
+            if content_type.startswith("application/pdf") or chunk.startswith(b"%PDF-"):
+                self._spool = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                    dir=pdf_spool_dir(), suffix=".part", delete=False
+                )
+            elif _is_file_type(content_type) or b"\0" in chunk[:1024]:
+                self.aborted = "file"
+                return CURL_WRITEFUNC_ERROR
+        if self._spool is not None:
+            return self._write_pdf(chunk)
+        room = _MAX_BODY_BYTES - self._size
+        if len(chunk) > room:
+            self._chunks.append(chunk[:room])
+            self._size += room
+            self.aborted = "truncated"
+            return CURL_WRITEFUNC_ERROR
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        return len(chunk)
+
+    def _write_pdf(self, chunk: bytes) -> int:
+        self._size += len(chunk)
+        if self._size > _MAX_PDF_BYTES:
+            self.aborted = "too large"
+            return CURL_WRITEFUNC_ERROR
+        self._spool.write(chunk)
+        self._digest.update(chunk)
+        return len(chunk)
+
+    @property
+    def is_pdf(self) -> bool:
+        return self._spool is not None
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(self._chunks)
+
+    def store_pdf(self, url: str) -> Path | None:
+        """Move a spooled PDF into the content-addressed store and return its path."""
+        if self._spool is None:
+            return None
+        self._spool.close()
+        return store_pdf(url, Path(self._spool.name), self._digest.hexdigest())
+
+    def discard(self) -> None:
+        """Delete a partially spooled PDF after a failed transfer."""
+        if self._spool is not None:
+            self._spool.close()
+            with contextlib.suppress(OSError):
+                os.unlink(self._spool.name)
+
+
+def _decode_body(response: object, body: bytes) -> str:
+    """Decode a streamed body using the response charset, defaulting to UTF-8."""
+    try:
+        return body.decode(response.charset_encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _get_session() -> Session:
+    """Return this thread's pooled HTTP session, creating it on first use.
+
+    The session keeps TLS connections alive per host (HTTP/2 where the server
+    negotiates it), so repeat fetches skip the handshake. curl handles are
+    not thread-safe, hence one session per thread.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = Session(impersonate="safari")
+        _local.session = session
+    return session
+
+
+def _fetch_response(
+    url: str, headers: dict[str, str] | None = None, *, pdf: bool = False
+) -> tuple[object, _BodySink]:
+    """Fetch URL and return the response with its streamed body; raises FetchError on failure.
 
     Retries once after a short delay on timeout or HTTP 5xx. Non-retryable
-    errors (4xx, connection refused) fail immediately.
+    errors (4xx, connection refused) fail immediately. pdf swaps the total
+    time limit for a stall limit; a page fetch that times out while spooling
+    a PDF is retried that way.
     """
     for attempt in range(2):
+        session = _get_session()
+        session.curl_options = _PDF_CURL_OPTIONS if pdf else {}
+        sink = _BodySink(session)
         try:
-            response = _http_get(
-                url,
-                impersonate="safari",
-                allow_redirects=True,
-                timeout=_TIMEOUT,
-            )
+            try:
+                response = session.get(
+                    url,
+                    headers=headers,
+                    allow_redirects=True,
+                    timeout=None if pdf else _TIMEOUT,
+                    content_callback=sink,
+                )
+            except RequestException as e:
+                # Our own abort surfaces as a write error; headers are intact.
+                if sink.aborted is None or e.response is None:
+                    raise
+                response = e.response
             if response.status_code >= 400:
+                sink.discard()
                 if response.status_code >= 500 and attempt == 0:
                     time.sleep(_RETRY_DELAY)
                     continue
                 raise FetchError(f"HTTP {response.status_code}")
-            return response
+            if sink.aborted == "too large":
+                sink.discard()
+                raise FetchError(f"file exceeds {_MAX_PDF_BYTES} bytes")
+            if sink.aborted == "truncated":
+                click.echo(f"[response truncated at {_MAX_BODY_BYTES} bytes]", err=True)
+            return response, sink
         except Timeout as e:
+            sink.discard()
+            pdf = pdf or sink.is_pdf
             if attempt == 0:
                 time.sleep(_RETRY_DELAY)
                 continue
             raise FetchError("timeout") from e
         except _CurlConnError as e:
+            sink.discard()
             raise FetchError(f"URL unreachable: {e}") from e
         except RequestException as e:
+            sink.discard()
             raise FetchError(f"URL unreachable: {e}") from e
     raise FetchError("timeout")  # unreachable; satisfies type checker
 
 
-def fetch_markdown(url: str) -> str:
+def download_pdf(url: str) -> Path:
+    """Download a PDF into the content-addressed store and return its local path."""
+    _, sink = _fetch_response(url, pdf=True)
+    path = sink.store_pdf(url)
+    if path is None:
+        raise FetchError("URL did not return a PDF")
+    return path
+
+
+def fetch_page(url: str, validators: dict[str, str] | None = None) -> FetchedPage:
     """Fetch a URL directly and extract content as clean markdown.
 
     Raises FetchError on network errors, non-HTML responses, or when
     content extraction fails. Automatically retries with a headless browser
     when the initial response looks like a bot-challenge page.
+
+    validators holds the ETag/Last-Modified of a previous response; a 304
+    returns a FetchedPage with markdown None so the caller reuses its copy.
+    Validators are only returned for statically extracted pages.
+
+    Hosts that keep needing the browser skip the static fetch. Every
+    browser render that extracts content counts toward that, so such hosts
+    stay above the threshold instead of decaying back to a wasted static
+    attempt. A host whose static pages usually extract still gets the browser
+    when one comes back empty, and that outcome moves its score.
     """
     is_reddit = _is_reddit(url)
     if is_reddit:
         url = _to_old_reddit(url)
 
-    response = _fetch_response(url)
-
+    host = urlparse(url).hostname or ""
+    strategy = None if is_reddit else _host_strategy(host)
+    if strategy == "browser":
+        click.echo("[browser: host previously required it]", err=True)
+        return FetchedPage(_browser_markdown(url, host))
+
+    headers = {
+        _VALIDATOR_HEADERS[name]: value
+        for name, value in (validators or {}).items()
+        if name in _VALIDATOR_HEADERS
+    }
+    response, sink = _fetch_response(url, headers or None)
+    fresh_validators = {
+        name: value for name in _VALIDATOR_HEADERS if (value := response.headers.get(name))
+    }
+    if response.status_code == 304:
+        return FetchedPage(None, fresh_validators or dict(validators or {}))
+
+    pdf_path = sink.store_pdf(url)
     content_type = response.headers.get("content-type", "")
-    if any(content_type.startswith(t) for t in _FILE_CONTENT_TYPES):
-        raise FetchError("URL serves a file, not an HTML page; try `research pdf URL` instead")
+    if pdf_path is not None or sink.aborted == "file" or _is_file_type(content_type):
+        raise FileResponseError(pdf_path)
 
+    text = _decode_body(response, sink.body)
     if content_type.lower().startswith("text/plain"):
-        return response.text
+        return FetchedPage(text, fresh_validators)
 
+    tree = _parse_html(text)
     if is_reddit:
-        markdown = _extract_reddit(response.text)
+        markdown = _extract_reddit(tree)
         if not markdown:
             raise FetchError("no content extracted")
-        return markdown
+        return FetchedPage(markdown, fresh_validators)
 
-    if _is_challenge_page(response.text):
+    if _is_challenge_page(tree, text):
         click.echo("[browser fallback: challenge page detected]", err=True)
-        try:
-            html = fetch_with_browser(url)
-        except Exception as e:
-            raise FetchError(f"browser fallback failed: {e}") from e
-        if _is_challenge_page(html):
-            raise FetchError("browser fallback failed: still a challenge page")
-        markdown = trafilatura.extract(
-            html,
-            output_format="markdown",
-            include_links=True,
-            include_tables=True,
-        )
-        if not markdown:
-            raise FetchError("browser fallback failed: no content extracted")
-        return markdown
-
-    markdown = trafilatura.extract(
-        response.text,
-        output_format="markdown",
-        include_links=True,
-        include_tables=True,
-    )
+        return FetchedPage(_browser_markdown(url, host))
 
+    markdown = _extract_markdown(tree)
     if markdown:
-        return markdown
+        _record_host(host, needed_browser=False)
+        return FetchedPage(markdown, fresh_validators)
 
-    # trafilatura found nothing; page likely requires JS rendering.
-    click.echo("[browser fallback: no content extracted from static HTML]", err=True)
+    # trafilatura found nothing; page likely requires JS rendering. A host
+    # with a static record may still mix in JS-only pages.
+    reason = "host usually static, " if strategy == "static" else ""
+    click.echo(f"[browser fallback: {reason}no content extracted from static HTML]", err=True)
     try:
         html = fetch_with_browser(url)
     except Exception as e:
         raise FetchError(f"no content extracted (browser fallback failed: {e})") from e
-    markdown = trafilatura.extract(
-        html,
-        output_format="markdown",
-        include_links=True,
-        include_tables=True,
-    )
+    markdown = _extract_markdown(_parse_html(html))
     if not markdown:
         raise FetchError("no content extracted (page may require JavaScript)")
+    _record_host(host, needed_browser=True)
+    return FetchedPage(markdown)
+
+
+def _browser_markdown(url: str, host: str) -> str:
+    """Render a URL in the browser and extract it; raises FetchError on failure.
+
+    A successful render raises the host's browser score so it keeps skipping
+    the static fetch; a failed render lowers it so the static path is
+    retried next time.
+    """
+    try:
+        html = fetch_with_browser(url)
+    except Exception as e:
+        _record_host(host, needed_browser=False)
+        raise FetchError(f"browser fallback failed: {e}") from e
+    tree = _parse_html(html)
+    if _is_challenge_page(tree, html):
+        raise FetchError("browser fallback failed: still a challenge page")
+    markdown = _extract_markdown(tree)
+    if not markdown:
+        raise FetchError("browser fallback failed: no content extracted")
+    _record_host(host, needed_browser=True)
     return markdown
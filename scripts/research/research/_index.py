@@ -0,0 +1,191 @@
+"""Paragraph offset table, inverted term index, and outline for cached documents.
+
+Built once when a long document is cached so repeated `--find` calls only
+touch paragraphs that can match. Terms are lowercase ``\\w+`` runs; a literal
+needle can only occur in a paragraph holding, for each of its own word runs,
+a term that run can sit in. A run with non-word characters on both sides in
+the needle must be a whole term (a dict lookup); a run with one only before
+it must start a term, and one with one only after it must end a term, both
+found by bisecting a sorted term list. Only a needle that is a single bare
+run is matched as a substring of every term. Patterns that are not plain
+literals (or alternations of literals) cannot use the index and fall back to
+a full scan.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+
+_TERM_RE = re.compile(r"\w+")
+_HEADING_RE = re.compile(r"(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$")
+_FENCES = ("```", "~~~")
+_REGEX_META = frozenset("\\.^$*+?{}[]()|")
+
+# Shorter documents scan fast enough that an index is not worth storing.
+INDEX_MIN_CHARS = 50_000
+
+
+def build_index(text: str) -> dict[str, Any]:
+    """Return the paragraph offsets and term postings for text.
+
+    "vocab" is the sorted term list and "terms" maps each term to its
+    position in it; "by_suffix" orders those positions by reversed term, so
+    prefix and suffix lookups are a bisect each. Term i's paragraphs are
+    postings[bounds[i]:bounds[i + 1]]. Flat arrays keep the stored index
+    small and quick to unpickle.
+    """
+    offsets = array("I")
+    holders: dict[str, list[int]] = {}
+    position = 0
+    for number, paragraph in enumerate(text.split("\n\n")):
+        offsets.append(position)
+        position += len(paragraph) + 2
+        for term in set(_TERM_RE.findall(paragraph.lower())):
+            holders.setdefault(term, []).append(number)
+    vocab = sorted(holders)
+    postings = array("H" if len(offsets) <= 0xFFFF else "I")
+    bounds = array("I", [0])
+    for term in vocab:
+        postings.extend(holders[term])
+        bounds.append(len(postings))
+    return {
+        "length": len(text),
+        "offsets": offsets,
+        "vocab": vocab,
+        "terms": {term: i for i, term in enumerate(vocab)},
+        "by_suffix": array("I", sorted(range(len(vocab)), key=lambda i: vocab[i][::-1])),
+        "bounds": bounds,
+        "postings": postings,
+    }
+
+
+def paragraph_count(index: dict[str, Any]) -> int:
+    """Return the number of paragraphs in the indexed document."""
+    return len(index["offsets"])
+
+
+def paragraph_at(text: str, index: dict[str, Any], number: int) -> str:
+    """Slice one paragraph out of text without splitting the whole document."""
+    offsets = index["offsets"]
+    end = offsets[number + 1] - 2 if number + 1 < len(offsets) else len(text)
+    return text[offsets[number] : end]
+
+
+def _literal_alternatives(pattern: str) -> list[str] | None:
+    """Return the literal needles a pattern matches, or None if it is a real regex.
+
+    Invalid regex is matched as one literal substring by apply_find.
+    """
+    try:
+        re.compile(pattern)
+    except re.error:
+        return [pattern]
+    alternatives = pattern.split("|")
+    if any(char in _REGEX_META for alternative in alternatives for char in alternative):
+        return None
+    return alternatives
+
+
+def _starting_with(order: Sequence[int], prefix: str, key: Callable[[int], str]) -> Iterator[int]:
+    """Yield the term positions in order whose key starts with prefix.
+
+    order must be sorted by key, so the run is found with one bisect.
+    """
+    for position in range(bisect_left(order, prefix, key=key), len(order)):
+        i = order[position]
+        if not key(i).startswith(prefix):
+            break
+        yield i
+
+
+def _terms_holding(index: dict[str, Any], word: str, *, starts: bool, ends: bool) -> Iterable[int]:
+    """Return the positions of the terms a needle's word run can sit in.
+
+    starts/ends say whether the run has a non-word character before/after it
+    in the needle, which pins it to the start/end of a document term.
+    """
+    vocab: list[str] = index["vocab"]
+    if starts and ends:
+        return [index["terms"][word]] if word in index["terms"] else []
+    if starts:
+        return _starting_with(range(len(vocab)), word, vocab.__getitem__)
+    if ends:
+        return _starting_with(index["by_suffix"], word[::-1], lambda i: vocab[i][::-1])
+    return (i for i, term in enumerate(vocab) if word in term)
+
+
+def candidates(index: dict[str, Any], pattern: str) -> set[int] | None:
+    """Return paragraph numbers that may match pattern, or None for a full scan."""
+    alternatives = _literal_alternatives(pattern)
+    if alternatives is None:
+        return None
+    bounds, postings = index["bounds"], index["postings"]
+    found: set[int] = set()
+    for alternative in alternatives:
+        needle = alternative.lower()
+        runs = list(_TERM_RE.finditer(needle))
+        if not runs:
+            return None
+        matched: set[int] | None = None
+        for run in runs:
+            holders: set[int] = set()
+            starts, ends = run.start() > 0, run.end() < len(needle)
+            for i in _terms_holding(index, run[0], starts=starts, ends=ends):
+                holders.update(postings[bounds[i] : bounds[i + 1]])
+            matched = holders if matched is None else matched & holders
+            if not matched:
+                break
+        found |= matched or set()
+    return found
+
+
+def extract_headings(text: str) -> list[tuple[int, str, int]]:
+    """Return (level, title, char offset) for each ATX heading outside code fences."""
+    headings: list[tuple[int, str, int]] = []
+    position = 0
+    fence: str | None = None
+    for line in text.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped.startswith(_FENCES):
+            if fence is None:
+                fence = stripped[:3]
+            elif stripped.startswith(fence):
+                fence = None
+        elif fence is None:
+            match = _HEADING_RE.match(line.rstrip("\r\n"))
+            if match:
+                headings.append((len(match[1]), match[2], position))
+        position += len(line)
+    return headings
+
+
+def find_section(
+    headings: list[tuple[int, str, int]], title: str, length: int
+) -> tuple[str, int, int] | None:
+    """Return (heading, start, end) of the section a title names, or None.
+
+    An exact case-insensitive heading match wins over a substring match; the
+    first heading wins among equals. A section runs until the next heading
+    of the same or a higher level that starts after it, so headings placed
+    at one offset (PDF bookmarks sharing a page) never yield an empty body.
+    """
+    wanted = title.strip().casefold()
+    exact = [i for i, (_, text, _) in enumerate(headings) if text.casefold() == wanted]
+    partial = [i for i, (_, text, _) in enumerate(headings) if wanted in text.casefold()]
+    matches = exact or partial
+    if not matches:
+        return None
+    level, text, start = headings[matches[0]]
+    end = next(
+        (
+            offset
+            for lvl, _, offset in headings[matches[0] + 1 :]
+            if lvl <= level and offset > start
+        ),
+        length,
+    )
+    return text, start, end
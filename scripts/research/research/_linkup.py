@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import subprocess
+import threading
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
+from research._cache import _bump_stat
 from research._errors import die
 
 if TYPE_CHECKING:
     from linkup import LinkupClient
 
 RBW_ITEM = "linkup-api-key"
+# The rbw result is cached in the session kernel keyring so later research
+# processes skip rbw (and any unlock prompt) until the key times out.
+_KEYRING_DESC = "research:linkup-api-key"
+KEYRING_TTL: int = int(os.environ.get("RESEARCH_KEYRING_TTL") or 8 * 3600)
 
 _ERROR_MESSAGES = {
     "LinkupAuthenticationError": "authentication failed",
@@ -22,12 +31,57 @@ _ERROR_MESSAGES = {
     "LinkupTooManyRequestsError": "rate limited, try again later",
 }
 
+# Held while one thread replaces a key that failed authentication.
+_reauth_lock = threading.Lock()
 
-def get_linkup_api_key() -> str:
-    """Return the Linkup API key from env or rbw."""
-    import os
 
+def _keyctl(*args: str, stdin: str | None = None) -> str | None:
+    """Run keyctl and return its stdout, or None when it fails or is not installed."""
+    try:
+        result = subprocess.run(
+            ["keyctl", *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _read_keyring() -> str | None:
+    """Return the key cached in the session keyring, if present and unexpired."""
+    key = (_keyctl("pipe", f"%user:{_KEYRING_DESC}") or "").strip()
+    return key or None
+
+
+def _write_keyring(key: str) -> None:
+    """Cache the key in the session keyring for KEYRING_TTL seconds."""
+    key_id = (_keyctl("padd", "user", _KEYRING_DESC, "@s", stdin=key) or "").strip()
+    if key_id:
+        _keyctl("timeout", key_id, str(KEYRING_TTL))
+
+
+def _forget_key() -> bool:
+    """Drop the cached key and client after an auth failure; False if nothing to retry.
+
+    A key from LINKUP_API_KEY is never cached, so a retry cannot help.
+    """
+    if os.environ.get("LINKUP_API_KEY"):
+        return False
+    _keyctl("purge", "user", _KEYRING_DESC)
+    get_client.cache_clear()
+    return True
+
+
+def get_linkup_api_key() -> str:
+    """Return the Linkup API key from env, the session keyring, or rbw."""
     key = os.environ.get("LINKUP_API_KEY")
+    if key:
+        return key
+    key = _read_keyring()
     if key:
         return key
     try:
@@ -45,16 +99,30 @@ def get_linkup_api_key() -> str:
     key = result.stdout.strip()
     if not key:
         die(f"rbw returned empty value for {RBW_ITEM}")
+    _write_keyring(key)
     return key
 
 
+@functools.cache
 def get_client() -> LinkupClient:
-    """Return a configured LinkupClient."""
+    """Return a configured LinkupClient, shared by every search in the process."""
     from linkup import LinkupClient
 
     return LinkupClient(api_key=get_linkup_api_key())
 
 
+def _refresh_client(stale: LinkupClient) -> LinkupClient | None:
+    """Return a client to retry with after `stale` failed auth; None if a retry cannot help.
+
+    Concurrent failures queue on one lock: the first thread purges the keyring
+    and rereads rbw, and the rest retry with the client it built.
+    """
+    with _reauth_lock:
+        if get_client() is stale and not _forget_key():
+            return None
+        return get_client()
+
+
 def translate_error(action: str, e: Exception) -> str:
     """Translate backend-specific exceptions into agent-facing messages."""
     from research._render import format_error
@@ -67,29 +135,61 @@ def translate_error(action: str, e: Exception) -> str:
     return format_error(action, reason)
 
 
+def _request(client: LinkupClient, query: str, max_results: int, sourced_answer: bool) -> object:
+    return client.search(
+        query=query,
+        depth="standard",
+        output_type="sourcedAnswer" if sourced_answer else "searchResults",
+        max_results=max_results,
+    )
+
+
 def search(query: str, max_results: int = 5, sourced_answer: bool = True) -> object:
-    """Execute a Linkup search or sourced-answer request."""
-    client = get_client()
+    """Execute a Linkup search or sourced-answer request.
+
+    An authentication failure drops the keyring-cached key and retries once
+    with a key freshly read from rbw.
+    """
     try:
-        response = client.search(
-            query=query,
-            depth="standard",
-            output_type="sourcedAnswer" if sourced_answer else "searchResults",
-            max_results=max_results,
-        )
-        return response
+        client = get_client()
+        try:
+            response = _request(client, query, max_results, sourced_answer)
+        except Exception as e:
+            if type(e).__name__ != "LinkupAuthenticationError":
+                raise
+            client = _refresh_client(client)
+            if client is None:
+                raise
+            response = _request(client, query, max_results, sourced_answer)
     except Exception as e:
         raise SearchError(translate_error("search", e)) from e
+    _bump_stat("search:paid")
+    return response
 
 
 class SearchError(Exception):
     """Search operation failed."""
 
 
+def result_records(results: list) -> list[dict[str, str]]:
+    """Return search results as plain dicts for caching."""
+    return [
+        {
+            "type": getattr(r, "type", None) or "text",
+            "name": r.name,
+            "url": r.url,
+            "content": getattr(r, "content", "") or "",
+        }
+        for r in results
+    ]
+
+
 def format_search_results(results: list) -> str:
-    """Format search results as markdown prose."""
+    """Format search results (or result_records dicts) as markdown prose."""
     lines: list[str] = []
     for i, r in enumerate(results, 1):
+        if isinstance(r, dict):
+            r = SimpleNamespace(**r)
         if getattr(r, "type", None) == "image":
             lines.append(f"{i}. [image] {r.name}\n   URL: {r.url}")
             continue
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
 
 import click
 
+from research import _index
+
 
 def section_heading(title: str) -> str:
     """Return a markdown section heading."""
@@ -67,58 +71,176 @@ def _match_lines(para: str, matches: object, context: int) -> str:
     return "\n".join(lines[i] for i in sorted(keep))
 
 
-def apply_find(text: str, pattern: str, context: int) -> str:
-    """Return paragraphs matching pattern with context paragraphs around them.
+def _fix_alternation(pattern: str) -> str:
+    """Convert grep-style \\| alternation to regex |, with a hint."""
+    if r"\|" not in pattern:
+        return pattern
+    click.echo(
+        "[hint: converted \\| to | for regex alternation; use | directly next time]",
+        err=True,
+    )
+    return pattern.replace(r"\|", "|")
+
+
+def _matcher(pattern: str) -> Callable[[str], object]:
+    """Return a case-insensitive regex search, or a literal one for invalid regex."""
+    try:
+        return re.compile(pattern, re.IGNORECASE).search
+    except re.error:
+        needle = pattern.lower()
+
+        def matches(para: str) -> bool:
+            return needle in para.lower()
+
+        return matches
+
 
+def find_matches(
+    text: str, patterns: Sequence[str], context: int, index: dict[str, Any] | None = None
+) -> list[str]:
+    """Return, per pattern, the matching paragraphs with context paragraphs around them.
+
+    All patterns are evaluated in one pass over the paragraphs.
     Pattern is tried as a case-insensitive regex. Falls back to literal
     substring matching when the pattern is not valid regex.
     Mega-paragraphs (> _MEGA_PARA_THRESHOLD chars) are matched at line level
     to avoid returning thousands of unrelated characters.
+    When the document's paragraph index is given and every pattern is
+    literal, only the candidate paragraphs it returns are scanned.
+    """
+    patterns = [_fix_alternation(pattern) for pattern in patterns]
+    matchers = [_matcher(pattern) for pattern in patterns]
+
+    numbers: set[int] | None = None
+    if index is not None and index["length"] == len(text):
+        found = [_index.candidates(index, pattern) for pattern in patterns]
+        if all(candidates is not None for candidates in found):
+            numbers = set().union(*found)
+    if numbers is not None:
+        count = _index.paragraph_count(index)
+
+        def paragraph(i: int) -> str:
+            return _index.paragraph_at(text, index, i)
+
+        scan: Iterable[int] = sorted(numbers)
+    else:
+        paragraphs = text.split("\n\n")
+        count = len(paragraphs)
+        paragraph = paragraphs.__getitem__
+        scan = range(count)
+
+    keeps: list[set[int]] = [set() for _ in patterns]
+    mega_extracts: list[dict[int, str]] = [{} for _ in patterns]
+    for i in scan:
+        para = paragraph(i)
+        mega = len(para) > _MEGA_PARA_THRESHOLD
+        for matches, keep, extracts in zip(matchers, keeps, mega_extracts, strict=True):
+            if mega:
+                extracted = _match_lines(para, matches, context)
+                if extracted:
+                    extracts[i] = extracted
+                    keep.add(i)
+            elif matches(para):
+                lo = max(0, i - context)
+                hi = min(count, i + context + 1)
+                keep.update(range(lo, hi))
+
+    results = []
+    for pattern, keep, extracts in zip(patterns, keeps, mega_extracts, strict=True):
+        if not keep:
+            preview = "\n\n".join(paragraph(i) for i in range(min(3, count)))
+            if len(preview) > 500:
+                preview = preview[:500] + "..."
+            results.append(
+                f"[no paragraphs matched '{pattern}']\n\n"
+                f"--- content preview (first 3 paragraphs) ---\n{preview}"
+            )
+            continue
+        results.append("\n\n".join(extracts.get(i) or paragraph(i) for i in sorted(keep)))
+    return results
+
+
+def apply_find(
+    text: str,
+    patterns: Sequence[str],
+    context: int,
+    max_chars: int,
+    index: dict[str, Any] | None = None,
+) -> str:
+    """Return find results for one or more patterns.
+
+    A single pattern returns its matches as-is. Several patterns are grouped
+    under a header each, and every group is truncated to an equal share of
+    max_chars so the whole output fits the caller's limit.
     """
-    if r"\|" in pattern:
-        fixed = pattern.replace(r"\|", "|")
-        click.echo(
-            "[hint: converted \\| to | for regex alternation; use | directly next time]",
-            err=True,
-        )
-        pattern = fixed
+    results = find_matches(text, patterns, context, index)
+    if len(results) == 1:
+        return results[0]
+    headers = [f'--- find "{pattern}" ---\n' for pattern in patterns]
+    share = 0
+    if max_chars > 0:
+        overhead = sum(len(header) for header in headers) + 2 * (len(headers) - 1)
+        share = max(1, (max_chars - overhead) // len(results))
+    return "\n\n".join(
+        header + truncate_output(result, share)
+        for header, result in zip(headers, results, strict=True)
+    )
 
-    paragraphs = text.split("\n\n")
 
-    try:
-        compiled = re.compile(pattern, re.IGNORECASE)
-        matches = compiled.search
-    except re.error:
-        needle = pattern.lower()
+def format_outline(headings: list[tuple[int, str, int]], total_len: int) -> str:
+    """Return a compact table of contents with each heading's char offset."""
+    if not headings:
+        return f"[no headings found; total length {total_len}]"
+    lines = [f"[outline: {len(headings)} headings; total length {total_len}]", ""]
+    lines.extend(f"{offset:>8}  {'  ' * (level - 1)}{title}" for level, title, offset in headings)
+    return "\n".join(lines)
 
-        def matches(para: str) -> bool:
-            return needle in para.lower()
 
-    keep: set[int] = set()
-    mega_extracts: dict[int, str] = {}
-    for i, para in enumerate(paragraphs):
-        if len(para) > _MEGA_PARA_THRESHOLD:
-            extracted = _match_lines(para, matches, context)
-            if extracted:
-                mega_extracts[i] = extracted
-                keep.add(i)
-        elif matches(para):
-            lo = max(0, i - context)
-            hi = min(len(paragraphs), i + context + 1)
-            keep.update(range(lo, hi))
-    if not keep:
-        preview = "\n\n".join(paragraphs[:3])
-        if len(preview) > 500:
-            preview = preview[:500] + "..."
-        return (
-            f"[no paragraphs matched '{pattern}']\n\n"
-            f"--- content preview (first 3 paragraphs) ---\n{preview}"
-        )
-
-    def _para_text(i: int) -> str:
-        return mega_extracts.get(i, paragraphs[i])
-
-    return "\n\n".join(_para_text(i) for i in sorted(keep))
+def render_document(
+    text: str,
+    find: Sequence[str],
+    context: int,
+    max_chars: int,
+    offset: int = 0,
+    *,
+    index: dict[str, Any] | None = None,
+    headings: list[tuple[int, str, int]] | None = None,
+    outline: bool = False,
+    section: str | None = None,
+) -> str:
+    """Apply --outline, --section, --offset, and --find to a document, then truncate.
+
+    headings is the outline stored at cache time; it is extracted here only
+    when the caller has none.
+    """
+    total_len = len(text)
+    if (outline or section) and headings is None:
+        headings = _index.extract_headings(text)
+    if outline:
+        return truncate_output(format_outline(headings or [], total_len), max_chars)
+
+    banner = ""
+    if section:
+        span = _index.find_section(headings or [], section, total_len)
+        if span is None:
+            output = f"[no section matched '{section}']\n\n" + format_outline(
+                headings or [], total_len
+            )
+            return truncate_output(output, max_chars)
+        title, start, end = span
+        text = text[start:end]
+        banner = f"[section '{title}': chars {start}-{end} of {total_len}"
+        banner += f"; starting at offset {offset} within it]" if offset > 0 else "]"
+    elif offset > 0:
+        banner = f"[starting at char offset {offset}; total length {total_len}]"
+
+    if offset > 0:
+        text = text[offset:]
+
+    output = apply_find(text, find, context, max_chars, index) if find else text
+    if banner:
+        output = f"{banner}\n\n{output}"
+    return truncate_output(output, max_chars)
 
 
 def reroute_message(url: str, new_command: str, reason: str) -> None:
@@ -0,0 +1,48 @@
+"""Detached worker that prefetches search-result pages into the content cache.
+
+Spawned by `web search --warm N` and run as ``python -m research._warm URL...``.
+It charges no budget: each warmed page is flagged for the session that ran
+the search, so that session's first `web fetch` of it reserves budget as if
+it had fetched the page itself.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from research._budget import mark_warmed
+
+_WARM_WORKERS = 4
+
+
+def spawn(urls: list[str]) -> None:
+    """Start a detached warm worker for urls and return immediately."""
+    subprocess.Popen(
+        [sys.executable, "-m", "research._warm", *urls],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _warm_one(url: str) -> None:
+    """Fetch one page into the cache; failures are left for the real fetch."""
+    from research._fetch import FetchError
+    from research.web import _load_page
+
+    if not isinstance(_load_page(url), FetchError):
+        mark_warmed(url)
+
+
+def warm(urls: list[str]) -> None:
+    """Fetch and cache urls concurrently."""
+    with ThreadPoolExecutor(max_workers=min(_WARM_WORKERS, len(urls))) as pool:
+        list(pool.map(_warm_one, urls))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        warm(sys.argv[1:])
@@ -0,0 +1,190 @@
+"""Shared cache inspection and maintenance subcommands."""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Any
+
+import click
+
+from research._cache import (
+    _ERRORS_DIR,
+    _PDF_DIR,
+    content_stats,
+    drop_cached_url,
+    evict_content,
+    evict_pdfs,
+    evict_searches,
+    file_stats,
+    prefix_stats,
+    prune_older_than,
+    search_stats,
+    vacuum_stores,
+)
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3}
+_DURATION_RE = re.compile(r"(\d+)([smhdw])")
+_SIZE_RE = re.compile(r"(\d+)([kmg]?)(?:i?b)?")
+
+
+def _format_bytes(size: int) -> str:
+    """Return a compact binary-unit size."""
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def _format_age(timestamp: float | None) -> str:
+    """Return how long ago a timestamp was, in the largest whole unit."""
+    if timestamp is None:
+        return "n/a"
+    seconds = max(time.time() - timestamp, 0)
+    for unit, length in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= length:
+            return f"{seconds / length:.0f}{unit} ago"
+    return f"{seconds:.0f}s ago"
+
+
+def _parse_duration(ctx: click.Context, param: click.Parameter, value: str | None) -> int | None:
+    """Parse --older-than "30m", "12h", "7d", or "2w" into seconds."""
+    if value is None:
+        return None
+    match = _DURATION_RE.fullmatch(value.strip().lower())
+    if not match:
+        raise click.BadParameter(f"expected a number with s/m/h/d/w, got: {value}")
+    return int(match[1]) * _DURATION_UNITS[match[2]]
+
+
+def _parse_size(ctx: click.Context, param: click.Parameter, value: str | None) -> int | None:
+    """Parse --max-size "500M", "2G", or a byte count into bytes."""
+    if value is None:
+        return None
+    match = _SIZE_RE.fullmatch(value.strip().lower())
+    if not match:
+        raise click.BadParameter(f"expected a size like 500M or 2G, got: {value}")
+    return int(match[1]) * _SIZE_UNITS[match[2]]
+
+
+def _echo_row(label: str, stats: dict[str, Any]) -> None:
+    click.echo(
+        f"- {label}: {stats['entries']} entries, {_format_bytes(stats['bytes'])}, "
+        f"oldest {_format_age(stats['oldest'])}, newest {_format_age(stats['newest'])}"
+    )
+
+
+def _usage_rows() -> list[tuple[str, dict[str, Any]]]:
+    """Return (label, stats) for everything the cache keeps on disk."""
+    from research.scout._clone import CLONE_BASE, clone_stats
+
+    rows = [(f"{row['store']} {row['prefix']}", row) for row in prefix_stats()]
+    rows.append(("pdf files", file_stats(_PDF_DIR, "*.pdf")))
+    rows.append(("error ledgers", file_stats(_ERRORS_DIR, "*.jsonl")))
+    rows.append((f"repos ({CLONE_BASE})", clone_stats()))
+    return rows
+
+
+def _shrink_to(max_bytes: int) -> tuple[int, int]:
+    """Evict until everything `stats` counts fits max_bytes; return (removed, bytes left).
+
+    Pages go first (least recently used), then spooled PDFs, repo clones,
+    and finally search responses, which cost paid calls to replace. Budget
+    counters, statistics, and error ledgers are never evicted.
+    """
+    from research.scout._clone import evict_clones
+
+    excess = sum(stats["bytes"] for _, stats in _usage_rows()) - max_bytes
+    removed = 0
+    for evict in (evict_content, evict_pdfs, evict_clones, evict_searches):
+        if excess <= 0:
+            break
+        count, freed = evict(excess)
+        removed += count
+        excess -= freed
+    return removed, max_bytes + excess
+
+
+def _hit_rate(hits: int, misses: int) -> str:
+    lookups = hits + misses
+    rate = f"{hits / lookups:.0%}" if lookups else "n/a"
+    return f"{hits} of {lookups} lookups ({rate})"
+
+
+@click.group(invoke_without_command=False)
+def cli() -> None:
+    """Inspect and maintain the shared research cache."""
+
+
+@cli.command(name="stats")
+def stats_cmd() -> None:
+    """Print entries and bytes per store and prefix, hit rates, and compression."""
+    rows = _usage_rows()
+    click.echo(f"entries ({_format_bytes(sum(stats['bytes'] for _, stats in rows))} total):")
+    for label, stats in rows:
+        _echo_row(label, stats)
+
+    stats = content_stats()
+    raw, stored = stats["raw_bytes"], stats["stored_bytes"]
+    ratio = f"{raw / stored:.1f}x" if stored else "n/a"
+    click.echo("content:")
+    click.echo(f"- hits: {_hit_rate(stats['hits'], stats['misses'])}")
+    click.echo(f"- size: {_format_bytes(stats['volume'])} of {_format_bytes(stats['limit'])}")
+    click.echo(f"- compression: {ratio} ({_format_bytes(raw)} -> {_format_bytes(stored)} written)")
+    click.echo(f"- evictions: {stats['evictions']}")
+
+    search = search_stats()
+    click.echo("search:")
+    click.echo(f"- hits: {_hit_rate(search['hits'], search['misses'])}")
+    click.echo(f"- paid Linkup calls: {search['paid']}")
+
+
+@cli.command(name="prune")
+@click.option(
+    "--older-than",
+    "max_age",
+    callback=_parse_duration,
+    help="remove pages, searches, PDFs, error ledgers, and repo clones older than this (e.g. 7d)",
+)
+@click.option(
+    "--max-size",
+    "max_bytes",
+    callback=_parse_size,
+    help="evict pages, then PDFs, repo clones, and searches (least recently used first) "
+    "until everything `stats` counts fits this size (e.g. 500M)",
+)
+def prune_cmd(max_age: int | None, max_bytes: int | None) -> None:
+    """Remove cache entries by age and/or size. Budget counters are never pruned."""
+    if max_age is None and max_bytes is None:
+        raise click.UsageError("give --older-than, --max-size, or both")
+    if max_age is not None:
+        from research.scout._clone import prune_clones
+
+        click.echo(f"removed {prune_older_than(max_age)} cache entries older than {max_age}s")
+        click.echo(f"removed {prune_clones(max_age)} repo clones")
+    if max_bytes is not None:
+        removed, left = _shrink_to(max_bytes)
+        click.echo(f"evicted {removed} entries; cache now {_format_bytes(left)}")
+        if left > max_bytes:
+            click.echo(
+                f"could not reach {_format_bytes(max_bytes)}: the rest is budget state, "
+                "statistics, and error ledgers"
+            )
+
+
+@cli.command(name="vacuum")
+def vacuum_cmd() -> None:
+    """Drop expired entries and compact each SQLite store."""
+    for store, before, after in vacuum_stores():
+        click.echo(f"{store}: {_format_bytes(before)} -> {_format_bytes(after)}")
+
+
+@cli.command(name="drop")
+@click.argument("url")
+def drop_cmd(url: str) -> None:
+    """Forget everything cached for one URL so the next fetch goes to the network."""
+    removed = drop_cached_url(url)
+    click.echo(f"dropped {removed} entries for {url}" if removed else f"nothing cached for {url}")
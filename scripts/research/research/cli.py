@@ -1,55 +1,52 @@
-"""Root CLI group with auto-discovery of subcommand modules."""
+"""Root CLI group with a static manifest of lazily imported subcommands."""
 
 from __future__ import annotations
 
 import importlib
-import pkgutil
-from pathlib import Path
 
 import click
 
 from research._click import HelpfulGroup
 
-
-class _AutoGroup(HelpfulGroup):
-    """Click group that auto-discovers subcommand modules.
-
-    Any module in the research package that exposes a ``cli`` attribute
-    (a click.Group or click.Command) is registered as a subcommand.
-    Modules whose names start with ``_`` are skipped (private helpers).
-    """
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._loaded = False
-
-    def _load_plugins(self) -> None:
-        if self._loaded:
-            return
-        self._loaded = True
-        pkg_path = str(Path(__file__).parent)
-        for info in pkgutil.iter_modules([pkg_path]):
-            if info.name.startswith("_") or info.name == "cli":
-                continue
-            try:
-                mod = importlib.import_module(f"research.{info.name}")
-            except Exception:  # noqa: BLE001, S112
-                continue
-            cmd = getattr(mod, "cli", None)
-            if isinstance(cmd, click.Command):
-                self.add_command(cmd, info.name)
+# Subcommand name -> (module exposing ``cli``, short help for the listing).
+# Only the invoked subcommand's module is imported, so `research status` or
+# `--help` never pays for trafilatura, curl_cffi, or lxml. Add new
+# subcommand modules here.
+_COMMANDS: dict[str, tuple[str, str]] = {
+    "cache": ("research.cache", "Inspect and maintain the shared research cache."),
+    "errors": (
+        "research.errors",
+        "Print every failed invocation recorded in this research session.",
+    ),
+    "pdf": ("research.pdf", "Download, OCR, and convert PDF to markdown."),
+    "scout": ("research.scout", "Explore GitHub repositories and workflows."),
+    "status": ("research.status", "Print current budget usage."),
+    "web": ("research.web", "Web search and page fetching via Linkup."),
+}
+
+
+class _LazyGroup(HelpfulGroup):
+    """Click group that resolves subcommands from _COMMANDS on demand."""
 
     def list_commands(self, ctx: click.Context) -> list[str]:
-        self._load_plugins()
-        return super().list_commands(ctx)
+        return sorted(_COMMANDS)
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
-        self._load_plugins()
-        return super().get_command(ctx, cmd_name)
+        entry = _COMMANDS.get(cmd_name)
+        if entry is None:
+            return None
+        cmd = getattr(importlib.import_module(entry[0]), "cli", None)
+        return cmd if isinstance(cmd, click.Command) else None
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List commands from the manifest without importing their modules."""
+        rows = [(name, short_help) for name, (_, short_help) in sorted(_COMMANDS.items())]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
 
 
 @click.group(
-    cls=_AutoGroup,
+    cls=_LazyGroup,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 @click.version_option(version=__import__("research").__version__, prog_name="research")
@@ -2,84 +2,306 @@
 
 from __future__ import annotations
 
+import json
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import click
 
 from research._budget import budget_refund, budget_reserve
-from research._cache import cache_url, get_cache, read_cached_content, write_cached_content
-from research._render import DEFAULT_MAX_CHARS, apply_find, truncate_output
+from research._cache import (
+    cache_url,
+    read_cached_content,
+    read_cached_headings,
+    read_cached_index,
+    read_cached_pdf,
+    read_cached_pdf_outline,
+    read_cached_pdf_page_count,
+    read_cached_pdf_pages,
+    write_cached_content,
+    write_cached_pdf_pages,
+)
+from research._render import DEFAULT_MAX_CHARS, render_document
+
+_PROGRESS_PREFIX = "[pdf2md:"
+
+
+def _parse_page_range(
+    ctx: click.Context, param: click.Parameter, value: str | None
+) -> tuple[int, int] | None:
+    """Parse --pages "A-B" (or a single page "N") into an inclusive range."""
+    if value is None:
+        return None
+    first, sep, last = value.partition("-")
+    try:
+        start = int(first)
+        end = int(last) if sep else start
+    except ValueError:
+        raise click.BadParameter(f"expected A-B, got: {value}") from None
+    if start < 1 or end < start:
+        raise click.BadParameter(f"expected A-B with 1 <= A <= B, got: {value}")
+    return start, end
 
 
 @click.command()
 @click.argument("url")
-@click.option("--find", help="show only paragraphs matching this pattern")
+@click.option(
+    "--find",
+    multiple=True,
+    help="show only paragraphs matching this pattern (repeatable)",
+)
 @click.option("-C", "--context", type=int, default=0, help="paragraphs of context around matches")
 @click.option("--max-chars", type=int, default=DEFAULT_MAX_CHARS)
 @click.option("--offset", type=int, default=0, help="char offset into content for pagination")
 @click.option("--critical", is_flag=True, help="use a reserved post-warning call")
+@click.option("--outline", is_flag=True, help="list headings with char offsets")
+@click.option("--section", help="show only the section under this heading")
+@click.option(
+    "--pages",
+    callback=_parse_page_range,
+    metavar="A-B",
+    help="convert only this range of PDF pages",
+)
 def cli(
     url: str,
-    find: str | None,
+    find: tuple[str, ...],
     context: int,
     max_chars: int,
     offset: int,
     critical: bool,
+    outline: bool,
+    section: str | None,
+    pages: tuple[int, int] | None,
 ) -> None:
     """Download, OCR, and convert PDF to markdown."""
-    _do_pdf(url, find, context, max_chars, offset, critical)
+    _do_pdf(url, find, context, max_chars, offset, critical, outline, section, pages)
 
 
 def _do_pdf(
     url: str,
-    find: str | None,
+    find: tuple[str, ...],
     context: int,
     max_chars: int,
     offset: int = 0,
     critical: bool = False,
+    outline: bool = False,
+    section: str | None = None,
+    pages: tuple[int, int] | None = None,
 ) -> None:
-    """Internal PDF handler shared with web reroute."""
+    """Internal PDF handler shared with web reroute.
+
+    The PDF is converted from its local content-addressed copy, downloaded
+    here only when `web fetch` has not already spooled it. Conversion is
+    per page, so the whole document also fills the per-page cache.
+    """
     base_url = cache_url(url)
-    cache = get_cache()
+
+    if pages is not None:
+        text, headings = _load_pages(url, base_url, pages, critical)
+        click.echo(
+            render_document(
+                text,
+                find,
+                context,
+                max_chars,
+                offset,
+                headings=headings,
+                outline=outline,
+                section=section,
+            ),
+            nl=False,
+        )
+        return
 
     cached = read_cached_content(base_url)
     if cached is not None:
         text = cached
     else:
-        budget_reserve(cache, base_url, critical=critical)
-        try:
-            result = subprocess.run(
-                ["pdf2md", url],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-        except FileNotFoundError:
-            budget_refund(cache, base_url)
-            click.echo("error: command not found: pdf2md", err=True)
-            sys.exit(2)
-
-        if result.returncode != 0:
-            budget_refund(cache, base_url)
-            err = result.stderr.strip() or f"pdf2md exited {result.returncode}"
-            click.echo(f"error: pdf failed: {err}", err=True)
-            sys.exit(1)
-
-        text = result.stdout
+        text, headings = _load_pages(url, base_url, None, critical)
         if text:
-            write_cached_content(base_url, text)
+            write_cached_content(base_url, text, headings=headings)
 
-    total_len = len(text)
-    if offset > 0:
-        text = text[offset:]
+    click.echo(
+        render_document(
+            text,
+            find,
+            context,
+            max_chars,
+            offset,
+            index=read_cached_index(base_url) if find else None,
+            headings=read_cached_headings(base_url) if outline or section else None,
+            outline=outline,
+            section=section,
+        ),
+        nl=False,
+    )
 
-    if find:
-        output = apply_find(text, find, context)
-    else:
-        output = text
 
-    if offset > 0:
-        output = f"[starting at char offset {offset}; total length {total_len}]\n\n" + output
+def _pdf_path(url: str, base_url: str) -> Path:
+    """Return the spooled copy of a PDF, downloading it when `web fetch` has not."""
+    pdf_path = read_cached_pdf(base_url)
+    if pdf_path is not None:
+        return pdf_path
+    from research._fetch import FetchError, download_pdf
+
+    try:
+        return download_pdf(url)
+    except FetchError as e:
+        budget_refund(base_url)
+        click.echo(f"error: pdf failed: download failed: {e}", err=True)
+        sys.exit(1)
+
+
+def _run_pdf2md(base_url: str, args: list[str]) -> str:
+    """Run pdf2md and return its stdout; refunds the reserved call on failure.
+
+    pdf2md progress lines are forwarded to stderr as they arrive; any other
+    stderr output is kept for the error message.
+    """
+    try:
+        proc = subprocess.Popen(
+            ["pdf2md", *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except FileNotFoundError:
+        budget_refund(base_url)
+        click.echo("error: command not found: pdf2md", err=True)
+        sys.exit(2)
+
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        stdout = reader.submit(proc.stdout.read)
+        errors = []
+        for line in proc.stderr:
+            if line.startswith(_PROGRESS_PREFIX):
+                click.echo(line.rstrip("\n"), err=True)
+            else:
+                errors.append(line)
+        output = stdout.result()
+    returncode = proc.wait()
+
+    if returncode != 0:
+        budget_refund(base_url)
+        err = "".join(errors).strip() or f"pdf2md exited {returncode}"
+        click.echo(f"error: pdf failed: {err}", err=True)
+        sys.exit(1)
+    return output
+
+
+def _page_spec(numbers: list[int]) -> str:
+    """Return a pdf2md page spec (e.g. "3,5-7") for sorted page numbers."""
+    runs: list[list[int]] = []
+    for number in numbers:
+        if runs and number == runs[-1][1] + 1:
+            runs[-1][1] = number
+        else:
+            runs.append([number, number])
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in runs)
+
+
+def _title_offset(text: str, title: str, start: int, end: int) -> int | None:
+    """Return where title first appears in text[start:end], ignoring case and spacing."""
+    words = title.split()
+    if not words:
+        return None
+    pattern = re.compile(r"\s+".join(map(re.escape, words)), re.IGNORECASE)
+    match = pattern.search(text, start, end)
+    return match.start() if match else None
+
+
+def _outline_headings(
+    outline: list[tuple[int, str, int]] | None, text: str, starts: dict[int, int]
+) -> list[tuple[int, str, int]] | None:
+    """Place PDF bookmarks where their title appears in their [page N] block.
+
+    Bookmarks on one page are searched in outline order, each after the one
+    before it; a title not found in the converted text falls back to the
+    start of its page block. Returns None when the PDF has no bookmarks on
+    the shown pages, so the outline falls back to markdown headings in the
+    converted text.
+    """
+    bounds = sorted(starts.values()) + [len(text) + 2]
+    ends = {page: bounds[bounds.index(start) + 1] - 2 for page, start in starts.items()}
+    cursors = dict(starts)
+    headings = []
+    for level, title, page in outline or []:
+        if page not in starts:
+            continue
+        offset = _title_offset(text, title, cursors[page], ends[page])
+        if offset is None:
+            offset = starts[page]
+        else:
+            cursors[page] = offset + 1
+        headings.append((level, title, offset))
+    return sorted(headings, key=lambda heading: heading[2]) or None
+
+
+def _load_pages(
+    url: str, base_url: str, pages: tuple[int, int] | None, critical: bool
+) -> tuple[str, list[tuple[int, str, int]] | None]:
+    """Return markdown for a page range (None for the whole PDF) and its outline.
+
+    Each page becomes one [page N] block; the outline comes from the PDF's
+    bookmarks (None without any).
+
+    Pages are cached by PDF content hash and page number, so any range of an
+    already-converted PDF is assembled without running pdf2md or spending
+    budget; only missing pages are sent to pdf2md, which converts them in
+    parallel.
+    """
+    pdf_path = read_cached_pdf(base_url)
+    reserved = pdf_path is None
+    if reserved:
+        budget_reserve(base_url, critical=critical)
+        pdf_path = _pdf_path(url, base_url)
+    digest = pdf_path.stem
+    first, last = pages or (1, None)
+    page_count = read_cached_pdf_page_count(digest)
+    if page_count is not None:
+        last = page_count if last is None else min(last, page_count)
+
+    converted: dict[int, str] = {}
+    outline = read_cached_pdf_outline(digest)
+    missing: list[int] | None = None  # None: page count unknown, convert everything
+    if last is not None:
+        converted = read_cached_pdf_pages(digest, range(first, last + 1))
+        missing = [n for n in range(first, last + 1) if n not in converted]
+    if missing is None or missing:
+        if not reserved:
+            budget_reserve(base_url, critical=critical)
+            reserved = True
+        args = ["--json", str(pdf_path)]
+        if missing is not None:
+            args[1:1] = ["--pages", _page_spec(missing)]
+        result = json.loads(_run_pdf2md(base_url, args))
+        page_count = result["page_count"]
+        fresh = {int(n): text for n, text in result["pages"].items()}
+        outline = [tuple(entry) for entry in result.get("outline", [])]
+        write_cached_pdf_pages(digest, fresh, page_count, outline)
+        converted.update(fresh)
+        last = page_count if last is None else last
 
-    click.echo(truncate_output(output, max_chars), nl=False)
+    if page_count is not None and first > page_count:
+        if reserved:
+            budget_refund(base_url)
+        click.echo(f"error: page {first} out of range (document has {page_count} pages)", err=True)
+        sys.exit(1)
+    if pages is not None and page_count is not None and pages[1] > page_count:
+        click.echo(
+            f"[note: document has {page_count} pages; showing {first}-{page_count}]", err=True
+        )
+    blocks = []
+    starts: dict[int, int] = {}
+    position = 0
+    for n in sorted(converted):
+        if first <= n <= last:
+            block = f"[page {n}]\n\n{converted[n]}"
+            blocks.append(block)
+            starts[n] = position
+            position += len(block) + 2
+    text = "\n\n".join(blocks)
+    return text, _outline_headings(outline, text, starts)
@@ -8,7 +8,6 @@ from typing import Any
 
 import click
 
-from research._cache import get_cache
 from research._click import HelpfulGroup
 from research._ghapi import check_deps
 from research._scout_budget import scout_budget_reserve
@@ -21,7 +20,7 @@ def _budgeted(callback: Callable[..., Any]) -> Callable[..., Any]:
         parent = context.parent
         critical = bool(parent and parent.params.get("critical"))
         check_deps()
-        scout_budget_reserve(get_cache(), critical=critical)
+        scout_budget_reserve(critical=critical)
         return callback(*args, **kwargs)
 
     return wrapper
@@ -12,6 +12,7 @@ import threading
 import time
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -118,29 +119,95 @@ def _is_ready(repo_dir: Path) -> bool:
     return (repo_dir / MARKER).exists()
 
 
-def _cleanup_stale_clones(skip_owner: str, skip_repo: str) -> None:
-    """Remove repo clones whose marker is older than CLONE_MAX_AGE."""
-    import shutil
-
+def _clone_dirs() -> Generator[Path, None, None]:
+    """Yield every owner/repo clone directory."""
     if not CLONE_BASE.exists():
         return
-    now = time.time()
     for owner_dir in CLONE_BASE.iterdir():
-        if not owner_dir.is_dir():
+        if owner_dir.is_dir():
+            yield from (repo_dir for repo_dir in owner_dir.iterdir() if repo_dir.is_dir())
+
+
+def _tree_size(path: Path) -> int:
+    """Return the bytes of every file under path."""
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            with contextlib.suppress(OSError):
+                size += os.lstat(os.path.join(root, name)).st_size
+    return size
+
+
+def _marker_age(repo_dir: Path) -> float | None:
+    try:
+        return time.time() - (repo_dir / MARKER).stat().st_mtime
+    except OSError:
+        return None
+
+
+def _remove_clone(repo_dir: Path, max_age: float) -> bool:
+    """Remove a clone under its repo lock if its marker is still older than max_age.
+
+    The lock waits out a clone or pull in progress; the age is rechecked after
+    it, since a pull touches the marker.
+    """
+    import shutil
+
+    with _repo_lock(repo_dir.parent.name, repo_dir.name):
+        age = _marker_age(repo_dir)
+        if age is None or age <= max_age:
+            return False
+        shutil.rmtree(repo_dir, ignore_errors=True)
+        return True
+
+
+def prune_clones(max_age: float = CLONE_MAX_AGE, skip: tuple[str, str] | None = None) -> int:
+    """Remove repo clones whose marker is older than max_age; return the count."""
+    removed = 0
+    for repo_dir in list(_clone_dirs()):
+        if skip == (repo_dir.parent.name, repo_dir.name):
             continue
-        for repo_dir in owner_dir.iterdir():
-            if not repo_dir.is_dir():
-                continue
-            if owner_dir.name == skip_owner and repo_dir.name == skip_repo:
-                continue
-            marker = repo_dir / MARKER
-            if not marker.exists():
-                continue
-            try:
-                if now - marker.stat().st_mtime > CLONE_MAX_AGE:
-                    shutil.rmtree(repo_dir, ignore_errors=True)
-            except OSError:
-                pass
+        age = _marker_age(repo_dir)
+        if age is not None and age > max_age and _remove_clone(repo_dir, max_age):
+            removed += 1
+    return removed
+
+
+def evict_clones(nbytes: int) -> tuple[int, int]:
+    """Free nbytes of repo clones, least recently fetched first; return (clones, bytes)."""
+    ages = [
+        (age, repo_dir) for repo_dir in _clone_dirs() if (age := _marker_age(repo_dir)) is not None
+    ]
+    removed = freed = 0
+    for _, repo_dir in sorted(ages, key=lambda item: item[0], reverse=True):
+        if freed >= nbytes:
+            break
+        size = _tree_size(repo_dir)
+        if _remove_clone(repo_dir, 0):
+            removed += 1
+            freed += size
+    return removed, freed
+
+
+def clone_stats() -> dict[str, Any]:
+    """Return the clone count, bytes on disk, and oldest/newest fetch times."""
+    size = 0
+    fetched: list[float] = []
+    for repo_dir in _clone_dirs():
+        with contextlib.suppress(OSError):
+            fetched.append((repo_dir / MARKER).stat().st_mtime)
+        size += _tree_size(repo_dir)
+    return {
+        "entries": len(fetched),
+        "bytes": size,
+        "oldest": min(fetched, default=None),
+        "newest": max(fetched, default=None),
+    }
+
+
+def _cleanup_stale_clones(skip_owner: str, skip_repo: str) -> None:
+    """Remove repo clones whose marker is older than CLONE_MAX_AGE."""
+    prune_clones(skip=(skip_owner, skip_repo))
 
 
 def ensure_repo(owner: str, repo: str) -> Path:
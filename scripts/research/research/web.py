@@ -2,34 +2,53 @@
 
 from __future__ import annotations
 
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 
-from research._budget import budget_refund, budget_reserve
+from research._budget import budget_refund, budget_reserve, clear_warmed, is_warmed
 from research._cache import (
     cache_url,
-    get_cache,
+    is_content_cached,
+    normalize_query,
     read_cached_content,
+    read_cached_headings,
+    read_cached_index,
+    read_cached_results,
     read_cached_search,
+    read_stale_content,
+    refresh_cached_content,
     write_cached_content,
+    write_cached_results,
     write_cached_search,
 )
-from research._fetch import FetchError, fetch_markdown
-from research._linkup import SearchError, format_search_results, format_sourced_answer
+from research._fetch import FetchError, FileResponseError, fetch_page
+from research._linkup import (
+    SearchError,
+    format_search_results,
+    format_sourced_answer,
+    result_records,
+)
 from research._render import (
     DEFAULT_MAX_CHARS,
     DEFAULT_SCOUT_MAX_CHARS,
     apply_find,
     is_github_url,
     is_pdf_url,
+    render_document,
     reroute_message,
     strip_github_host,
     truncate_output,
 )
 
 DEFAULT_MAX_RESULTS = 5
+_FETCH_WORKERS = 6  # concurrent page fetches for multi-URL `web fetch`
+_SEARCH_WORKERS = 4  # concurrent Linkup requests for multi-query `web search`
+# Result URLs in format_search_results output, skipping image results.
+_RESULT_URL_RE = re.compile(r"^\d+\. (?!\[image\] ).*\n   URL: (\S+)$", re.MULTILINE)
 
 
 @click.group(invoke_without_command=False)
@@ -38,55 +57,200 @@ def cli() -> None:
 
 
 @cli.command(name="search")
-@click.argument("query")
+@click.argument("queries", metavar="QUERY...", nargs=-1, required=True)
 @click.option("--max-results", type=click.IntRange(min=1, max=10), default=DEFAULT_MAX_RESULTS)
 @click.option("--results", is_flag=True, help="return search results instead of a sourced answer")
 @click.option("--critical", is_flag=True, help="use a reserved post-warning call")
-def search_cmd(query: str, max_results: int, results: bool, critical: bool) -> None:
-    """Search the web via Linkup."""
+@click.option(
+    "--warm",
+    type=click.IntRange(min=0, max=10),
+    default=0,
+    metavar="N",
+    help="prefetch the top N result pages into the cache in the background",
+)
+def search_cmd(
+    queries: tuple[str, ...], max_results: int, results: bool, critical: bool, warm: int
+) -> None:
+    """Search the web via Linkup.
+
+    Multiple queries run concurrently and are printed in the order given.
+    With --warm N, the top N result pages are fetched by a detached worker
+    so a later `web fetch` of them is a cache hit; budget is still charged
+    when a warmed page is first read.
+    """
     sourced_answer = not results
-    cache_key = f"{sourced_answer}:{max_results}:{query}"
-    cached = read_cached_search(cache_key)
-    if cached is not None:
-        click.echo(cached)
-        return
+    unique: dict[str, str] = {}
+    for query in queries:
+        unique.setdefault(normalize_query(query), query)
+    queries = tuple(unique.values())
+    rendered: dict[str, str | SearchError] = {}
+    for query in queries:
+        cached = _read_search(query, max_results, sourced_answer)
+        if cached is not None:
+            rendered[query] = cached
+
+    pending = [query for query in queries if query not in rendered]
+    if pending:
+        budget_reserve(None, critical=critical, calls=len(pending))
+        from research._linkup import get_client
+
+        get_client()  # resolve the API key once, before the worker threads
+        with ThreadPoolExecutor(max_workers=min(_SEARCH_WORKERS, len(pending))) as pool:
+            fresh = pool.map(lambda q: _search_one(q, max_results, sourced_answer), pending)
+            rendered.update(zip(pending, fresh, strict=True))
+
+    failed = False
+    for index, query in enumerate(queries):
+        if len(queries) > 1:
+            if index:
+                click.echo("\n")
+            click.echo(f"=== {query} ===")
+        output = rendered[query]
+        if isinstance(output, SearchError):
+            budget_refund()
+            click.echo(f"error: {output}", err=True)
+            failed = True
+            continue
+        click.echo(output)
+        _warm_results(output, warm)
+    if failed:
+        sys.exit(1)
 
-    cache = get_cache()
-    budget_reserve(cache, None, critical=critical)
 
-    try:
-        from research._linkup import search
+def _read_search(query: str, max_results: int, sourced_answer: bool) -> str | None:
+    """Return a cached rendering of one search, or None on a miss."""
+    if sourced_answer:
+        return read_cached_search(f"answer:{max_results}:{normalize_query(query)}")
+    records = read_cached_results(query, max_results)
+    return format_search_results(records) if records is not None else None
+
+
+def _search_one(query: str, max_results: int, sourced_answer: bool) -> str | SearchError:
+    """Run and cache one Linkup search; returns the error instead of raising."""
+    from research._linkup import search
 
+    try:
         response = search(query, max_results, sourced_answer)
-        rendered = (
-            format_sourced_answer(response)
-            if sourced_answer
-            else format_search_results(response.results)
-        )
-        write_cached_search(cache_key, rendered)
-        click.echo(rendered)
     except SearchError as e:
-        budget_refund(cache)
-        click.echo(f"error: {e}", err=True)
-        sys.exit(1)
+        return e
+    if sourced_answer:
+        rendered = format_sourced_answer(response)
+        write_cached_search(f"answer:{max_results}:{normalize_query(query)}", rendered)
+        return rendered
+    records = result_records(response.results)
+    write_cached_results(query, max_results, records)
+    return format_search_results(records)
+
+
+def _warm_results(rendered: str, count: int) -> None:
+    """Spawn the background warmer for the uncached pages among the top count results."""
+    if count <= 0:
+        return
+    top = list(dict.fromkeys(_RESULT_URL_RE.findall(rendered)))[:count]
+    urls = [url for url in top if _is_plain_page(url) and not is_content_cached(url)]
+    if not urls:
+        return
+    from research._warm import spawn
+
+    spawn(urls)
+    click.echo(f"[warming {len(urls)} result pages in the background]", err=True)
 
 
 @cli.command(name="fetch")
-@click.argument("url")
-@click.option("--find", help="show only paragraphs matching this pattern")
+@click.argument("urls", metavar="URL...", nargs=-1, required=True)
+@click.option(
+    "--find",
+    multiple=True,
+    help="show only paragraphs matching this pattern (repeatable)",
+)
 @click.option("-C", "--context", type=int, default=0, help="paragraphs of context around matches")
 @click.option("--max-chars", type=int, default=DEFAULT_MAX_CHARS)
 @click.option("--offset", type=int, default=0, help="char offset into content for pagination")
 @click.option("--critical", is_flag=True, help="use a reserved post-warning call")
+@click.option("--outline", is_flag=True, help="list headings with char offsets")
+@click.option("--section", help="show only the section under this heading")
 def fetch_cmd(
+    urls: tuple[str, ...],
+    find: tuple[str, ...],
+    context: int,
+    max_chars: int,
+    offset: int,
+    critical: bool,
+    outline: bool,
+    section: str | None,
+) -> None:
+    """Fetch one or more URLs as clean markdown.
+
+    Multiple URLs are fetched concurrently and printed in the order given.
+    """
+    if len(urls) == 1:
+        _fetch_one(urls[0], find, context, max_chars, offset, critical, None, outline, section)
+        return
+
+    urls = tuple(dict.fromkeys(urls))
+    pages = _prefetch_pages(urls, critical)
+    failed = False
+    for index, url in enumerate(urls):
+        if index:
+            click.echo("\n")
+        click.echo(f"=== {url} ===")
+        try:
+            _fetch_one(
+                url, find, context, max_chars, offset, critical, pages.get(url), outline, section
+            )
+        except SystemExit as e:
+            failed = failed or e.code not in (None, 0)
+    if failed:
+        sys.exit(1)
+
+
+def _is_plain_page(url: str) -> bool:
+    """Return True when a URL goes straight to the HTML fetcher (no reroute)."""
+    return not is_github_url(url) and not is_pdf_url(url)
+
+
+def _load_page(url: str) -> str | FetchError:
+    """Fetch and cache one page; returns the error instead of raising.
+
+    An expired copy with validators is revalidated; on 304 it is reused
+    without re-extraction and its TTL restarts.
+    """
+    stale = read_stale_content(url)
+    try:
+        page = fetch_page(url, stale[1] if stale else None)
+    except FetchError as e:
+        return e
+    if page.markdown is None and stale:
+        refresh_cached_content(url)
+        return stale[0]
+    if page.markdown is None:
+        return FetchError("HTTP 304 without a cached copy")
+    write_cached_content(cache_url(url), page.markdown, page.validators)
+    return page.markdown
+
+
+def _prefetch_pages(urls: tuple[str, ...], critical: bool) -> dict[str, str | FetchError]:
+    """Fetch every uncached plain page concurrently under one batch reservation."""
+    pending = [url for url in urls if _is_plain_page(url) and not is_content_cached(url)]
+    if not pending:
+        return {}
+    budget_reserve([cache_url(url) for url in pending], critical=critical)
+    with ThreadPoolExecutor(max_workers=min(_FETCH_WORKERS, len(pending))) as pool:
+        return dict(zip(pending, pool.map(_load_page, pending), strict=True))
+
+
+def _fetch_one(
     url: str,
-    find: str | None,
+    find: tuple[str, ...],
     context: int,
     max_chars: int,
     offset: int,
     critical: bool,
+    page: str | FetchError | None = None,
+    outline: bool = False,
+    section: str | None = None,
 ) -> None:
-    """Fetch a URL as clean markdown."""
+    """Fetch and print one URL; page is a result already fetched by a batch."""
     # Check for reroutes before burning budget
     if is_github_url(url):
         path = strip_github_host(url)
@@ -264,14 +428,14 @@ def fetch_cmd(
                     click.echo(f"error: file not found: {file_path} at ref {ref}", err=True)
                     sys.exit(1)
                 content = result_proc.stdout
+                github_max = min(max_chars, DEFAULT_SCOUT_MAX_CHARS)
+                if github_max <= 0:
+                    github_max = DEFAULT_SCOUT_MAX_CHARS
                 if find:
-                    output = apply_find(content, find, context)
+                    output = apply_find(content, find, context, github_max)
                 else:
                     output = content
                 output = f"Source: {url}\n\n{output}"
-                github_max = min(max_chars, DEFAULT_SCOUT_MAX_CHARS)
-                if github_max <= 0:
-                    github_max = DEFAULT_SCOUT_MAX_CHARS
                 click.echo(truncate_output(output, github_max))
                 return
 
@@ -337,42 +501,41 @@ def fetch_cmd(
         reroute_message(url, f"pdf {url}", "URL points to a PDF")
         from research.pdf import _do_pdf
 
-        _do_pdf(url, find, context, max_chars, offset, critical)
+        _do_pdf(url, find, context, max_chars, offset, critical, outline, section)
         return
 
     base_url = cache_url(url)
-    cache = get_cache()
 
-    cached = read_cached_content(base_url)
-    if cached is not None:
-        markdown = cached
-    else:
-        budget_reserve(cache, base_url, critical=critical)
-        try:
-            markdown = fetch_markdown(url)
-        except FetchError as e:
-            msg = str(e)
-            if "file, not an HTML page" in msg:
-                reroute_message(url, f"pdf {url}", "response is a file, not HTML")
-                from research.pdf import _do_pdf
-
-                _do_pdf(url, find, context, max_chars, offset, critical)
-                return
-            budget_refund(cache, base_url)
-            click.echo(f"error: fetch failed: {msg}", err=True)
-            sys.exit(1)
-        write_cached_content(base_url, markdown)
-
-    total_len = len(markdown)
-    if offset > 0:
-        markdown = markdown[offset:]
-
-    if find:
-        output = apply_find(markdown, find, context)
-    else:
-        output = markdown
-
-    if offset > 0:
-        output = f"[starting at char offset {offset}; total length {total_len}]\n\n" + output
-
-    click.echo(truncate_output(output, max_chars), nl=False)
+    if page is None:
+        page = read_cached_content(base_url)
+        if page is not None and is_warmed(base_url):
+            budget_reserve(base_url, critical=critical)
+            clear_warmed(base_url)
+    if page is None:
+        budget_reserve(base_url, critical=critical)
+        page = _load_page(url)
+    if isinstance(page, FetchError):
+        msg = str(page)
+        if isinstance(page, FileResponseError):
+            reroute_message(url, f"pdf {url}", "response is a file, not HTML")
+            from research.pdf import _do_pdf
+
+            _do_pdf(url, find, context, max_chars, offset, critical, outline, section)
+            return
+        budget_refund(base_url)
+        click.echo(f"error: fetch failed: {msg}", err=True)
+        sys.exit(1)
+    click.echo(
+        render_document(
+            page,
+            find,
+            context,
+            max_chars,
+            offset,
+            index=read_cached_index(base_url) if find else None,
+            headings=read_cached_headings(base_url) if outline or section else None,
+            outline=outline,
+            section=section,
+        ),
+        nl=False,
+    )
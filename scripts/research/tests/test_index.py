@@ -0,0 +1,41 @@
+"""The --find paragraph index must never drop a paragraph a full scan matches."""
+
+from __future__ import annotations
+
+import pytest
+from research._index import build_index, candidates
+from research._render import find_matches
+
+PARAGRAPHS = [
+    "# Ownership",
+    "Each value in Rust has an owner. The owner drops the value.",
+    "Borrowing lets code use a value without taking ownership of it.",
+    "Use `String::from` to build an owned string; `&str` borrows one.",
+    "Lifetimes ensure references are valid as long as we need them.",
+    "The borrow checker compares scopes to determine whether borrows are valid.",
+]
+TEXT = "\n\n".join(PARAGRAPHS)
+
+NEEDLES = [
+    "own",  # bare run: substring of any term
+    "wnership of",  # first run pinned to the end of a term
+    " value",  # run pinned to the start of a term
+    "the owner drops",  # interior run must be a whole term
+    "rrowing lets",
+    "String::fr",
+    "as long as",
+    "borrow|lifetime",
+    "no such phrase",
+]
+
+
+@pytest.mark.parametrize("needle", NEEDLES)
+def test_index_matches_full_scan(needle: str) -> None:
+    index = build_index(TEXT)
+    assert candidates(index, needle) is not None
+    assert find_matches(TEXT, [needle], 0, index) == find_matches(TEXT, [needle], 0)
+
+
+def test_interior_run_needs_a_whole_term() -> None:
+    index = build_index(TEXT)
+    assert candidates(index, "an own drops") == set()
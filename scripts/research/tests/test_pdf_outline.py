@@ -0,0 +1,53 @@
+"""PDF bookmark placement for --outline and --section."""
+
+from __future__ import annotations
+
+from research._index import find_section
+from research.pdf import _outline_headings
+
+PAGES = {
+    1: "# Manual\n\nIntro text.",
+    2: "Scope\n\nWhat this covers.\n\nTerms\n\nWords we use.",
+    3: "Details follow.",
+}
+
+
+def _document() -> tuple[str, dict[int, int]]:
+    blocks, starts, position = [], {}, 0
+    for number, body in PAGES.items():
+        block = f"[page {number}]\n\n{body}"
+        blocks.append(block)
+        starts[number] = position
+        position += len(block) + 2
+    return "\n\n".join(blocks), starts
+
+
+def _section(text: str, headings: list[tuple[int, str, int]], title: str) -> str:
+    span = find_section(headings, title, len(text))
+    assert span is not None
+    _, start, end = span
+    return text[start:end]
+
+
+def test_bookmarks_on_one_page_get_their_own_offsets() -> None:
+    text, starts = _document()
+    outline = [(1, "Manual", 1), (1, "Scope", 2), (1, "Terms", 2), (1, "Details", 3)]
+    headings = _outline_headings(outline, text, starts)
+    assert headings is not None
+
+    scope = _section(text, headings, "Scope")
+    assert "What this covers." in scope
+    assert "Words we use." not in scope
+    assert _section(text, headings, "Terms").startswith("Terms\n\nWords we use.")
+
+
+def test_unmatched_bookmarks_on_one_page_keep_a_body() -> None:
+    text, starts = _document()
+    outline = [(1, "Manual", 1), (1, "Purpose", 2), (1, "Glossary", 2), (1, "Details", 3)]
+    headings = _outline_headings(outline, text, starts)
+    assert headings is not None
+
+    assert [offset for _, _, offset in headings][1:3] == [starts[2], starts[2]]
+    purpose = _section(text, headings, "Purpose")
+    assert "What this covers." in purpose
+    assert "Details follow." not in purpose
@@ -0,0 +1,53 @@
+"""Startup import budget and manifest checks for the lazy root CLI."""
+
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from research.cli import _COMMANDS
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("trafilatura", "curl_cffi", "lxml")
+
+
+def _imported_modules(*args: str) -> set[str]:
+    """Return top-level modules imported by `python -m research ARGS`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "research", *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip().split(".")[0])
+    return modules
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("--help",),
+        ("status", "--help"),
+        ("errors", "--help"),
+        ("cache", "--help"),
+        ("pdf", "--help"),
+        ("scout", "--help"),
+    ],
+    ids=lambda args: " ".join(args),
+)
+def test_help_skips_heavy_imports(args: tuple[str, ...]) -> None:
+    assert not _imported_modules(*args) & set(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize("name", sorted(_COMMANDS))
+def test_manifest_help_matches_command(name: str) -> None:
+    module, short_help = _COMMANDS[name]
+    command = importlib.import_module(module).cli
+    assert command.help.splitlines()[0].strip() == short_help